@@ -11,10 +11,19 @@ import fractions
 from ctypes import c_size_t
 from math import e,pi
 
+import sys
+
 import param
 
 
-from param import __version__  # noqa: API import
+if sys.version_info >= (3, 7):
+    def __getattr__(attr):
+        # Version of param, determined when first accessed
+        if attr == '__version__':
+            return param.__version__
+        raise AttributeError("module %r has no attribute %r" % (__name__, attr))
+else:
+    from param import __version__  # noqa: API import
 
 class TimeAware(param.Parameterized):
     """
@@ -40,12 +40,24 @@ from numbers import Real
 
 # Determine up-to-date version information, if possible, but with a
 # safe fallback to ensure that this file and parameterized.py are the
-# only two required files.
-try:
-    from .version import Version
-    __version__ = str(Version(fpath=__file__, archive_commit="$Format:%h$", reponame="param"))
-except:
-    __version__ = "0.0.0+unknown"
+# only two required files. As this may run git, __version__ is only
+# determined when it is first accessed (on Python 3.7+).
+def _get_version():
+    try:
+        from .version import get_cached_version
+        return get_cached_version(__file__, archive_commit="$Format:%h$", reponame="param")
+    except:
+        return "0.0.0+unknown"
+
+if sys.version_info >= (3, 7):
+    def __getattr__(attr):
+        if attr == '__version__':
+            global __version__
+            __version__ = _get_version()
+            return __version__
+        raise AttributeError("module %r has no attribute %r" % (__name__, attr))
+else:
+    __version__ = _get_version()
 
 try:
     import collections.abc as collections_abc
@@ -613,16 +625,14 @@ class Dynamic(Parameter):
             return self._produce_value(gen)
 
 
-    @instance_descriptor
-    def __set__(self,obj,val):
+    def _post_setter(self,obj,val):
         """
-        Call the superclass's set and keep this parameter's
-        instantiate value up to date (dynamic parameters
-        must be instantiated).
+        Keep this parameter's instantiate value up to date (dynamic
+        parameters must be instantiated).
 
         If val is dynamic, initialize it as a generator.
         """
-        super(Dynamic,self).__set__(obj,val)
+        super(Dynamic,self)._post_setter(obj,val)
 
         dynamic = callable(val)
         if dynamic: self._initialize_generator(val,obj)
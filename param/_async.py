@@ -3,7 +3,10 @@ Module that implements async/def function wrappers to be used
 by param internal callbacks. These are defined in a separate file due
 to py2 incompatibility with both `async/await` and `yield from` syntax.
 """
-from functools import wraps
+import asyncio
+
+from collections import deque
+from functools import partial, wraps
 
 def generate_depends(func):
     @wraps(func)
@@ -11,6 +14,19 @@ def generate_depends(func):
         return await func(*args, **kw)  # noqa: E999
     return _depends
 
+def generate_cached_depends(func, method_cache):
+    @wraps(func)
+    async def _depends(*args, **kw):  # noqa: E999
+        if len(args) != 1 or kw or not getattr(args[0], 'initialized', False):
+            return await func(*args, **kw)  # noqa: E999
+        cache = method_cache(args[0])
+        found, result, token = cache.lookup()
+        if not found:
+            result = await func(*args)  # noqa: E999
+            cache.store(token, result)
+        return result
+    return _depends
+
 def generate_caller(function, what='value', changed=None, callback=None, skip_event=None):
     async def caller(*events):  # noqa: E999
         if callback:
@@ -19,9 +35,125 @@ def generate_caller(function, what='value', changed=None, callback=None, skip_ev
             await function()  # noqa: E999
     return caller
 
+def generate_method_caller(method_name, what='value', changed=None, callback=None, skip_event=None):
+    async def caller(obj, *events):  # noqa: E999
+        if callback:
+            callback(*events)
+        if not skip_event or not skip_event(*events, what=what, changed=changed):
+            await getattr(obj, method_name)()  # noqa: E999
+    return caller
+
 def generate_callback(func, dependencies, kw):
     async def cb(*events):  # noqa: E999
         args = (getattr(dep.owner, dep.name) for dep in dependencies)
         dep_kwargs = {n: getattr(dep.owner, dep.name) for n, dep in kw.items()}
         await func(*args, **dep_kwargs)  # noqa: E999
     return cb
+
+
+class AsyncExecutor(object):
+    """
+    Executor for coroutine watchers, scheduling them as tasks on an
+    asyncio event loop. Register an instance as the executor of
+    coroutine watchers with:
+
+      param.parameterized.async_executor = AsyncExecutor(loop)
+
+    The calls of each watcher function are tracked separately: at
+    most max_concurrency of them run at once and further calls wait
+    for a running one to finish. If coalesce is True, a waiting call
+    is superseded by any later call of the same watcher function, so
+    that only the latest values are processed once the watcher can
+    keep up again.
+
+    Calls may be submitted from any thread; they are scheduled on the
+    loop (by default the event loop of the thread that submits the
+    first call). Errors raised by the coroutines are passed to the
+    exception handler of the loop.
+    """
+
+    def __init__(self, loop=None, max_concurrency=1, coalesce=True):
+        if max_concurrency < 1:
+            raise ValueError("AsyncExecutor max_concurrency must be at least 1, "
+                             "not %r." % max_concurrency)
+        self._loop = loop
+        self.max_concurrency = max_concurrency
+        self.coalesce = coalesce
+        self._running = {} # Number of running calls by watcher function
+        self._waiting = {} # Waiting calls by watcher function
+        self._tasks = set()
+        self._settled = []
+
+    @property
+    def loop(self):
+        if self._loop is None:
+            self._loop = asyncio.get_event_loop()
+        return self._loop
+
+    def __call__(self, function):
+        # Watcher functions are passed as partials bound to the events
+        key = getattr(function, 'func', function)
+        loop = self.loop
+        try:
+            running_loop = asyncio.get_running_loop()
+        except RuntimeError:
+            running_loop = None
+        if running_loop is loop:
+            self._schedule(key, function)
+        else:
+            loop.call_soon_threadsafe(self._schedule, key, function)
+
+    def _schedule(self, key, function):
+        if self._running.get(key, 0) < self.max_concurrency:
+            self._start(key, function)
+            return
+        waiting = self._waiting.setdefault(key, deque())
+        if self.coalesce:
+            waiting.clear()
+        waiting.append(function)
+
+    def _start(self, key, function):
+        self._running[key] = self._running.get(key, 0) + 1
+        task = self.loop.create_task(function())
+        self._tasks.add(task)
+        task.add_done_callback(partial(self._done, key))
+
+    def _done(self, key, task):
+        self._tasks.discard(task)
+        self._running[key] -= 1
+        if not self._running[key]:
+            del self._running[key]
+        if not task.cancelled() and task.exception() is not None:
+            self.loop.call_exception_handler({
+                'message': 'Exception in coroutine watcher',
+                'exception': task.exception(),
+                'task': task
+            })
+        waiting = self._waiting.get(key)
+        if waiting:
+            function = waiting.popleft()
+            if not waiting:
+                del self._waiting[key]
+            self._start(key, function)
+        elif not self._tasks and not self._waiting:
+            settled, self._settled = self._settled, []
+            for future in settled:
+                if not future.done():
+                    future.set_result(None)
+
+    @property
+    def pending(self):
+        """Number of calls that are running or waiting to run."""
+        return len(self._tasks) + sum(len(w) for w in self._waiting.values())
+
+    def settled(self):
+        """
+        Returns a future (to be awaited on the loop) that completes
+        once no calls are running or waiting to run.
+        """
+        future = self.loop.create_future()
+        if not self._tasks and not self._waiting:
+            future.set_result(None)
+        else:
+            self._settled.append(future)
+        return future
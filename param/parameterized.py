@@ -16,6 +16,9 @@ import inspect
 import random
 import numbers
 import operator
+import threading
+import time
+import weakref
 
 # Allow this file to be used standalone if desired, albeit without JSON serialization
 try:
@@ -24,10 +27,11 @@ except ImportError:
     serializer = None
 
 
-from collections import defaultdict, namedtuple, OrderedDict
+from bisect import bisect_left, bisect_right
+from collections import defaultdict, deque, namedtuple, OrderedDict
 from functools import partial, wraps, reduce
 from operator import itemgetter,attrgetter
-from types import FunctionType
+from types import FunctionType, MethodType
 
 import logging
 from contextlib import contextmanager
@@ -45,6 +49,11 @@ try:
 except:
     from inspect import getargspec as getfullargspec # python2
 
+try:
+    from concurrent.futures import Future, ProcessPoolExecutor
+except ImportError: # python2 without the futures backport
+    Future = ProcessPoolExecutor = None
+
 dt_types = (dt.datetime, dt.date)
 
 try:
@@ -137,16 +146,27 @@ def _batch_call_watchers(parameterized, enable=True, run=True):
 batch_watch = _batch_call_watchers # PARAM2_DEPRECATION: Remove this compatibility alias for param 2.0 and later.
 
 @contextmanager
-def batch_call_watchers(parameterized):
+def batch_call_watchers(parameterized, coalesce=False):
     """
     Context manager to batch events to provide to Watchers on a
     parameterized object.  This context manager queues any events
     triggered by setting a parameter on the supplied parameterized
     object, saving them up to dispatch them all at once when the
     context manager exits.
+
+    If coalesce is True, the events of each parameter (and `what`)
+    are merged into a single event spanning the batch, carrying the
+    original old value and the final new value, and setting the same
+    parameter again only updates that event. Watchers watching for
+    `onlychanged` are not invoked for a parameter whose final value
+    is equal to its original value. Coalescing applies to all the
+    events queued until they are dispatched, including those of an
+    enclosing batch.
     """
     BATCH_WATCH = parameterized.param._BATCH_WATCH
     parameterized.param._BATCH_WATCH = True
+    if coalesce:
+        parameterized.param._events.coalesce = True
     try:
         yield
     finally:
@@ -184,6 +204,7 @@ def discard_events(parameterized):
     parameterized.param._BATCH_WATCH = True
     watchers, events = (list(parameterized.param._watchers),
                         list(parameterized.param._events))
+    coalesce = parameterized.param._events.coalesce
     try:
         yield
     except:
@@ -191,13 +212,18 @@ def discard_events(parameterized):
     finally:
         parameterized.param._BATCH_WATCH = batch_watch
         parameterized.param._watchers = watchers
-        parameterized.param._events = events
+        parameterized.param._events = _EventQueue(events, coalesce)
 
 
 # External components can register an async executor which will run
 # async functions
 async_executor = None
 
+# An executor (e.g. a concurrent.futures.ThreadPoolExecutor) can be
+# registered to run all synchronous watchers that do not declare
+# their own executor (see Parameters.watch)
+watcher_executor = None
+
 
 def classlist(class_):
     """
@@ -227,20 +253,52 @@ def descendents(class_):
     return out[::-1]
 
 
+# Slot names of classes (see get_all_slots), which cannot change once
+# a class has been created
+_all_slots = weakref.WeakKeyDictionary()
+_inherited_param_slots = weakref.WeakKeyDictionary()
+
+def _get_slots(class_):
+    """
+    Returns a tuple of the slot names defined in `class_` and its
+    superclasses and a frozenset of the same names, computed once
+    per class.
+    """
+    slots = _all_slots.get(class_)
+    if slots is None:
+        # A subclass's __slots__ attribute does not contain slots defined
+        # in its superclass (the superclass' __slots__ end up as
+        # attributes of the subclass).
+        all_slots = []
+        parent_param_classes = [c for c in classlist(class_)[1::]]
+        for c in parent_param_classes:
+            if hasattr(c,'__slots__'):
+                all_slots+=c.__slots__
+        slots = _all_slots[class_] = (tuple(all_slots), frozenset(all_slots))
+    return slots
+
+
+def _inherited_slots(class_):
+    """
+    Returns the slots of the Parameter type `class_` that are inherited
+    from Parameters of the same name in Parameterized superclasses
+    (see ParameterizedMetaclass.__param_inheritance), in the order
+    they are defined.
+    """
+    slots = _inherited_param_slots.get(class_)
+    if slots is None:
+        slots = _inherited_param_slots[class_] = tuple(
+            s for s in OrderedDict.fromkeys(_get_slots(class_)[0])
+            if s not in ('owner', '_class_param', 'objtype', 'instantiate'))
+    return slots
+
+
 def get_all_slots(class_):
     """
     Return a list of slot names for slots defined in `class_` and its
     superclasses.
     """
-    # A subclass's __slots__ attribute does not contain slots defined
-    # in its superclass (the superclass' __slots__ end up as
-    # attributes of the subclass).
-    all_slots = []
-    parent_param_classes = [c for c in classlist(class_)[1::]]
-    for c in parent_param_classes:
-        if hasattr(c,'__slots__'):
-            all_slots+=c.__slots__
-    return all_slots
+    return list(_get_slots(class_)[0])
 
 
 def get_occupied_slots(instance):
@@ -343,6 +401,19 @@ def no_instance_params(cls):
     return cls
 
 
+def lazy_instantiation(cls):
+    """
+    Defers instantiating the values of the instantiate=True Parameters
+    of instances of the class until each value is first accessed,
+    rather than deep copying all of them when an instance is created.
+
+    Note that the value is then copied from the default as it is at
+    the time of the first access.
+    """
+    cls._lazy_instantiate = True
+    return cls
+
+
 def iscoroutinefunction(function):
     """
     Whether the function is an asynchronous coroutine function.
@@ -391,14 +462,54 @@ def depends(func, *dependencies, **kw):
     or Parameters of subobjects (Parameterized objects that are
     values of this object's parameters).  Dependencies can either be
     on Parameter values, or on other metadata about the Parameter.
+
+    With watch=True, a `debounce` or `throttle` interval (in
+    milliseconds) may be declared to coalesce bursts of events into
+    single calls, as for Parameters.watch. Declaring weak=True on a
+    method makes the watchers calling it (including those on
+    subobjects) reference its instance weakly.
+
+    With cache=True, the results of a method (called without
+    arguments) are cached on its instance, keyed on the values of its
+    dependencies, and recomputed once one of them has changed. Up to
+    `cache_size` results are kept (evicting the least recently used),
+    each for at most `cache_ttl` seconds if given.
     """
 
     # PARAM2_DEPRECATION: python2 workaround; python3 allows kw-only args
     # (i.e. "func, *dependencies, watch=False" rather than **kw and the check below)
     watch = kw.pop("watch", False)
     on_init = kw.pop("on_init", False)
-
-    if iscoroutinefunction(func):
+    debounce = kw.pop("debounce", None)
+    throttle = kw.pop("throttle", None)
+    if debounce is not None and throttle is not None:
+        raise ValueError("A watcher may be debounced or throttled, not both.")
+    weak = kw.pop("weak", False)
+    cache = kw.pop("cache", False)
+    cache_size = kw.pop("cache_size", 128)
+    cache_ttl = kw.pop("cache_ttl", None)
+
+    if cache:
+        if cache_size < 1:
+            raise ValueError("The cache_size of a cached method must be at "
+                             "least 1, not %r." % cache_size)
+        def method_cache(obj):
+            return _MethodCache.get(obj, func.__name__, cache_size, cache_ttl)
+    if cache and iscoroutinefunction(func):
+        from ._async import generate_cached_depends
+        _depends = generate_cached_depends(func, method_cache)
+    elif cache:
+        @wraps(func)
+        def _depends(*args, **kw):
+            if len(args) != 1 or kw or not getattr(args[0], 'initialized', False):
+                return func(*args, **kw)
+            method_cache_ = method_cache(args[0])
+            found, result, token = method_cache_.lookup()
+            if not found:
+                result = func(*args)
+                method_cache_.store(token, result)
+            return result
+    elif iscoroutinefunction(func):
         from ._async import generate_depends
         _depends = generate_depends(func)
     else:
@@ -434,6 +545,12 @@ def depends(func, *dependencies, **kw):
         raise AssertionError('Supplying keywords to the decorated method '
                              'or function is not supported when referencing '
                              'parameters by name.')
+    elif weak and not string_specs:
+        raise ValueError('Weakly referenced watchers are only supported for '
+                         'methods depending on parameters referenced by name.')
+    elif cache and deps and not string_specs:
+        raise ValueError('Caching is only supported for methods depending '
+                         'on parameters referenced by name.')
 
     if not string_specs and watch: # string_specs case handled elsewhere (later), in Parameterized.__init__
         if iscoroutinefunction(func):
@@ -445,6 +562,10 @@ def depends(func, *dependencies, **kw):
                 dep_kwargs = {n: getattr(dep.owner, dep.name) for n, dep in kw.items()}
                 return func(*args, **dep_kwargs)
 
+        if debounce is not None or throttle is not None:
+            # Shared by the watchers of all the groups
+            cb = _RateLimiter(cb, debounce=debounce, throttle=throttle)
+
         grouped = defaultdict(list)
         for dep in deps:
             grouped[id(dep.owner)].append(dep)
@@ -454,6 +575,12 @@ def depends(func, *dependencies, **kw):
     _dinfo = getattr(func, '_dinfo', {})
     _dinfo.update({'dependencies': dependencies,
                    'kw': kw, 'watch': watch, 'on_init': on_init})
+    if debounce is not None:
+        _dinfo['debounce'] = debounce
+    if throttle is not None:
+        _dinfo['throttle'] = throttle
+    if weak:
+        _dinfo['weak'] = weak
 
     _depends._dinfo = _dinfo
 
@@ -555,6 +682,9 @@ def output(func, *output, **kw):
     return _output
 
 
+# Parsed dependency specifications (see _parse_dependency_spec)
+_dependency_specs = {}
+
 def _parse_dependency_spec(spec):
     """
     Parses param.depends specifications into three components:
@@ -563,6 +693,13 @@ def _parse_dependency_spec(spec):
     2. The attribute being depended on, i.e. either a parameter or method
     3. The parameter attribute being depended on
     """
+    parsed = _dependency_specs.get(spec)
+    if parsed is None:
+        parsed = _dependency_specs[spec] = _parse_spec(spec)
+    return parsed
+
+
+def _parse_spec(spec):
     assert spec.count(":")<=1
     spec = spec.strip()
     m = re.match("(?P<path>[^:]*):?(?P<what>.*)", spec)
@@ -603,6 +740,24 @@ def _params_depended_on(minfo, dynamic=True, intermediate=True):
     return deps, dynamic_deps
 
 
+def _method_depended_on(cls, name, intermediate=True):
+    """
+    Returns the dependencies of the named method of a Parameterized
+    class resolved by _params_depended_on with dynamic=False, which
+    are cached on the class.
+    """
+    resolved = cls.param._depends.get('resolved')
+    if resolved is None:
+        resolved = cls.param._depends['resolved'] = {}
+    key = (name, intermediate)
+    deps = resolved.get(key)
+    if deps is None:
+        minfo = MInfo(cls=cls, inst=None, name=name, method=getattr(cls, name))
+        deps = resolved[key] = _params_depended_on(
+            minfo, dynamic=False, intermediate=intermediate)
+    return deps
+
+
 def _resolve_mcs_deps(obj, resolved, dynamic, intermediate=True):
     """
     Resolves constant and dynamic parameter dependencies previously
@@ -629,17 +784,40 @@ def _resolve_mcs_deps(obj, resolved, dynamic, intermediate=True):
     return dependencies
 
 
+def _update_deps_callback(obj, attribute):
+    """
+    Returns a callback updating the dependencies of obj through the
+    given attribute, for the watchers on its nested subobjects; the
+    callback must not keep obj alive if the method is weakly
+    referenced (see _m_caller).
+    """
+    obj_ref = weakref.ref(obj)
+    def callback(*events):
+        """
+        If a subobject changes, we need to notify the main
+        object to update the dependencies.
+        """
+        obj = obj_ref()
+        if obj is not None:
+            obj.param._update_deps(attribute)
+    return callback
+
+
 def _skip_event(*events, **kwargs):
     """
     Checks whether a subobject event should be skipped.
     Returns True if all the values on the new subobject
-    match the values on the previous subobject.
+    match the values on the previous subobject. The values are not
+    compared if both subobjects store them in the same place, i.e.
+    if the subobject was set again.
     """
     what = kwargs.get('what', 'value')
     changed = kwargs.get('changed')
     if changed is None:
         return False
     for e in events:
+        if e.old is e.new:
+            continue
         for p in changed:
             if what == 'value':
                 old = _Undefined if e.old is None else _getattrr(e.old, p, None)
@@ -647,7 +825,7 @@ def _skip_event(*events, **kwargs):
             else:
                 old = _Undefined if e.old is None else _getattrr(e.old.param[p], what, None)
                 new = _Undefined if e.new is None else _getattrr(e.new.param[p], what, None)
-            if not Comparator.is_equal(old, new):
+            if old is not new and not Comparator.is_equal(old, new):
                 return False
     return True
 
@@ -656,17 +834,48 @@ def _m_caller(self, method_name, what='value', changed=None, callback=None):
     """
     Wraps a method call adding support for scheduling a callback
     before it is executed and skipping events if a subobject has
-    changed but its values have not.
+    changed but its values have not. Calls triggered while events are
+    dispatched are scheduled (see _DependsScheduler), except for
+    coroutine methods and methods declaring a debounce or throttle
+    interval, whose calls are passed on to their rate limiter. Methods declared with weak=True are called through
+    a _WeakCallback, so that their watchers do not keep self alive.
     """
     function = getattr(self, method_name)
-    if iscoroutinefunction(function):
+    limiter = _method_rate_limiter(self, method_name, function)
+    queued = getattr(function, '_dinfo', {}).get('watch') == 'queued'
+    if getattr(function, '_dinfo', {}).get('weak', False):
+        if limiter is not None:
+            def caller(obj, *events):
+                if callback: callback(*events)
+                if not _skip_event(*events, what=what, changed=changed):
+                    method = getattr(obj, method_name)
+                    _method_rate_limiter(obj, method_name, method)(*events)
+        elif iscoroutinefunction(function):
+            from ._async import generate_method_caller
+            caller = generate_method_caller(method_name, what=what, changed=changed,
+                                            callback=callback, skip_event=_skip_event)
+        else:
+            def caller(obj, *events):
+                if callback: callback(*events)
+                if not _skip_event(*events, what=what, changed=changed):
+                    method = getattr(obj, method_name)
+                    if not _depends_scheduler.defer(obj, method_name, method, queued):
+                        return method()
+        caller = _WeakCallback(caller, self)
+    elif limiter is not None:
+        def caller(*events):
+            if callback: callback(*events)
+            if not _skip_event(*events, what=what, changed=changed):
+                limiter(*events)
+    elif iscoroutinefunction(function):
         from ._async import generate_caller
         caller = generate_caller(function, what=what, changed=changed, callback=callback, skip_event=_skip_event)
     else:
         def caller(*events):
             if callback: callback(*events)
             if not _skip_event(*events, what=what, changed=changed):
-                return function()
+                if not _depends_scheduler.defer(self, method_name, function, queued):
+                    return function()
     caller._watcher_name = method_name
     return caller
 
@@ -734,9 +943,23 @@ _add_doc(Event,
     `type`: `triggered` if this event was triggered explicitly), `changed` if
     the item was set and watching for `onlychanged`, `set` if the item was set,
     or  None if type not yet known
+
+    An Event is created once for each change and passed on as is to
+    all the Watchers receiving an Event of its type; a copy is only
+    made for the Watchers receiving a different type.
     """)
 
-_Watcher = namedtuple("Watcher", "inst cls fn mode onlychanged parameter_names what queued precedence")
+
+def _new_event(what, name, obj, cls, old, new, triggered):
+    """
+    Creates the Event for a change, typed for the common case of
+    Watchers watching for `onlychanged` (see
+    Parameters._update_event_type).
+    """
+    return tuple.__new__(Event, (what, name, obj, cls, old, new,
+                                 'triggered' if triggered else 'changed'))
+
+_Watcher = namedtuple("Watcher", "inst cls fn mode onlychanged parameter_names what queued precedence executor")
 
 class Watcher(_Watcher):
     """
@@ -770,26 +993,46 @@ class Watcher(_Watcher):
     `precedence`: A numeric value which determines the precedence of
                   the watcher.  Lower precedence values are executed
                   with higher priority.
+
+    `executor`: Executor on which to run the callback, or None to
+                use the executor of the Parameterized object or the
+                global one, if any (see Parameters.watch). Executors
+                are not pickled or copied along with the Watcher.
     """
 
     def __new__(cls_, *args, **kwargs):
         """
-        Allows creating Watcher without explicit precedence value.
+        Allows creating Watcher without explicit precedence and
+        executor values.
         """
+        if not kwargs:
+            # Fast path for positional construction (used internally
+            # and when unpickling)
+            if len(args) == 10:
+                return tuple.__new__(cls_, args)
+            elif len(args) == 8:
+                return tuple.__new__(cls_, args + (0, None))
         values = dict(zip(cls_._fields, args))
         values.update(kwargs)
         if 'precedence' not in values:
             values['precedence'] = 0
+        if 'executor' not in values:
+            values['executor'] = None
         return super(Watcher, cls_).__new__(cls_, **values)
 
     def __iter__(self):
         """
         Backward compatibility layer to allow tuple unpacking without
-        the precedence value. Important for Panel which creates a
-        custom Watcher and uses tuple unpacking. Will be dropped in
-        Param 3.x.
+        the precedence and executor values. Important for Panel which
+        creates a custom Watcher and uses tuple unpacking. Will be
+        dropped in Param 3.x.
         """
-        return iter(self[:-1])
+        return iter(self[:-2])
+
+    def __getnewargs__(self):
+        # Slicing does not go through __iter__, so the precedence is
+        # kept; executors cannot be pickled or copied
+        return self[:-1] + (None,)
 
     def __str__(self):
         cls = type(self)
@@ -797,6 +1040,778 @@ class Watcher(_Watcher):
         return "{cls}({attrs})".format(cls=cls.__name__, attrs=attrs)
 
 
+class _WatcherList(object):
+    """
+    Container for the Watchers registered on one item of a Parameter
+    (e.g. its value), as stored in Parameter.watchers and in the
+    _param_watchers of a Parameterized instance.
+
+    Watchers are kept sorted by precedence (and by registration order
+    for equal precedences) as they are added, so that dispatching an
+    event only has to iterate over them. Watchers are also indexed by
+    identity, so that removing one does not have to compare Watcher
+    namedtuples field by field.
+
+    Iterating over the container iterates over a snapshot of its
+    contents, so Watchers may be added or removed while an event is
+    being dispatched.
+    """
+
+    __slots__ = ['_keys', '_watchers', '_index', '_count', '_snapshot']
+
+    def __init__(self, watchers=()):
+        self._keys = []
+        self._watchers = []
+        self._index = {}
+        self._count = 0
+        self._snapshot = None
+        for watcher in watchers:
+            self.append(watcher)
+
+    def append(self, watcher):
+        # The running count makes every key unique and keeps Watchers
+        # with equal precedence in registration order
+        key = (watcher.precedence, self._count)
+        self._count += 1
+        i = bisect_right(self._keys, key)
+        self._keys.insert(i, key)
+        self._watchers.insert(i, watcher)
+        self._index.setdefault(id(watcher), []).append(key)
+        self._snapshot = None
+
+    def remove(self, watcher):
+        keys = self._index.get(id(watcher))
+        if not keys:
+            # Fall back to equality, as for list.remove
+            for w in self._watchers:
+                if w == watcher:
+                    watcher, keys = w, self._index[id(w)]
+                    break
+            else:
+                raise ValueError('%s not in watchers' % watcher)
+        key = keys.pop(0)
+        if not keys:
+            del self._index[id(watcher)]
+        i = bisect_left(self._keys, key)
+        del self._keys[i]
+        del self._watchers[i]
+        self._snapshot = None
+
+    def _get_snapshot(self):
+        if self._snapshot is None:
+            self._snapshot = tuple(self._watchers)
+        return self._snapshot
+
+    def __iter__(self):
+        return iter(self._get_snapshot())
+
+    def __getitem__(self, index):
+        return self._get_snapshot()[index]
+
+    def __len__(self):
+        return len(self._watchers)
+
+    def __bool__(self):
+        return bool(self._watchers)
+
+    __nonzero__ = __bool__
+
+    def __contains__(self, watcher):
+        return watcher in self._watchers
+
+    def __repr__(self):
+        return repr(self._watchers)
+
+    def __reduce__(self):
+        # The identity index cannot be pickled or copied; rebuild it
+        return (type(self), (list(self._watchers),))
+
+
+class _EventQueue(list):
+    """
+    Queue of the Events batched on a Parameterized object or class,
+    which also indexes the latest Event queued for each (name, what)
+    pair as Events arrive, so that batched watchers can look up their
+    Events directly.
+
+    If coalesce is True (see batch_call_watchers), the queue holds a
+    single Event per (name, what) pair, which spans all the Events
+    queued for it: the old value of the first one and the new value
+    (and type) of the last one.
+    """
+
+    __slots__ = ['index', 'coalesce', '_positions']
+
+    def __init__(self, events=(), coalesce=False):
+        super(_EventQueue, self).__init__()
+        self.index = {}
+        self.coalesce = coalesce
+        self._positions = {}
+        self.extend(events)
+
+    def append(self, event):
+        key = (event.name, event.what)
+        if self.coalesce:
+            first = self.index.get(key)
+            if first is not None:
+                event = tuple.__new__(Event, event[:4] + (first.old,) + event[5:])
+                self[self._positions[key]] = event
+                self.index[key] = event
+                return
+            self._positions[key] = len(self)
+        super(_EventQueue, self).append(event)
+        self.index[key] = event
+
+    def extend(self, events):
+        for event in events:
+            self.append(event)
+
+    def __iadd__(self, events):
+        self.extend(events)
+        return self
+
+    def __reduce__(self):
+        return (type(self), (list(self), self.coalesce))
+
+
+class _WatcherQueue(list):
+    """
+    Queue of the Watchers batched on a Parameterized object or class,
+    in the order they were queued, which ignores Watchers that are
+    already queued (compared by identity).
+    """
+
+    __slots__ = ['_ids']
+
+    def __init__(self, watchers=()):
+        super(_WatcherQueue, self).__init__()
+        self._ids = set()
+        self.extend(watchers)
+
+    def append(self, watcher):
+        if id(watcher) not in self._ids:
+            self._ids.add(id(watcher))
+            super(_WatcherQueue, self).append(watcher)
+
+    def extend(self, watchers):
+        for watcher in watchers:
+            self.append(watcher)
+
+    def __iadd__(self, watchers):
+        self.extend(watchers)
+        return self
+
+    def __reduce__(self):
+        return (type(self), (list(self),))
+
+
+
+
+class _ExecutorCalls(object):
+    """
+    Watcher calls of a Parameterized object or class that have been
+    submitted to executors.
+
+    A call only starts once all the calls submitted before it have
+    finished, except that consecutive calls of different Watchers with
+    the same precedence start together and may run concurrently. The
+    calls of a Watcher therefore run in the order of the events, and
+    Watchers with a lower precedence finish before those with a
+    higher precedence start.
+    """
+
+    def __init__(self):
+        self._condition = threading.Condition()
+        self._count = 0          # Calls of the running group
+        self._precedence = None  # Precedence of the running group
+        self._watchers = set()   # Ids of the Watchers of the running group
+        self._pending = deque()  # Groups waiting for the running group
+        self._errors = []
+
+    def submit(self, executor, watcher, fn, args, kwargs):
+        call = (executor, fn, args, kwargs)
+        with self._condition:
+            if self._pending:
+                precedence, watchers, calls = self._pending[-1]
+                if precedence == watcher.precedence and id(watcher) not in watchers:
+                    watchers.add(id(watcher))
+                    calls.append(call)
+                else:
+                    self._pending.append((watcher.precedence, {id(watcher)}, [call]))
+                return
+            elif self._count == 0:
+                self._precedence, self._watchers = watcher.precedence, set()
+            elif (self._precedence != watcher.precedence or
+                  id(watcher) in self._watchers):
+                self._pending.append((watcher.precedence, {id(watcher)}, [call]))
+                return
+            self._watchers.add(id(watcher))
+            self._count += 1
+        self._start([call])
+
+    def _start(self, calls):
+        for executor, fn, args, kwargs in calls:
+            try:
+                future = executor.submit(fn, *args, **kwargs)
+            except Exception as e: # e.g. the executor has been shut down
+                future = Future()
+                future.set_exception(e)
+            future.add_done_callback(self._done)
+
+    def _done(self, future):
+        calls = None
+        with self._condition:
+            if not future.cancelled() and future.exception() is not None:
+                self._errors.append(future.exception())
+            self._count -= 1
+            if self._count == 0:
+                if self._pending:
+                    self._precedence, self._watchers, calls = self._pending.popleft()
+                    self._count = len(calls)
+                else:
+                    self._condition.notify_all()
+        if calls:
+            self._start(calls)
+
+    def join(self, timeout=None):
+        """
+        Waits for all the submitted calls to finish, raising the first
+        exception raised by any of them since the last join. Returns
+        False if the calls did not finish within the timeout.
+        """
+        with self._condition:
+            if self._count or self._pending:
+                self._condition.wait(timeout)
+                while timeout is None and (self._count or self._pending):
+                    self._condition.wait()
+            if self._count or self._pending:
+                return False
+            errors, self._errors = self._errors, []
+        if errors:
+            raise errors[0]
+        return True
+
+
+_executor_calls_lock = threading.Lock()
+
+_monotonic = getattr(time, 'monotonic', time.time) # python2
+
+
+class _RateLimiter(object):
+    """
+    Watcher callback wrapper that coalesces bursts of events into a
+    single call of the wrapped function `fn`, made with one event per
+    parameter and `what` carrying the `old` value of the first event
+    and the `new` value of the last one of the burst (or, in
+    'kwargs' mode, with the latest values).
+
+    With `debounce` (in milliseconds) the call is made once no event
+    has occurred for that long. With `throttle` (in milliseconds) the
+    first event is passed on immediately and the events occurring in
+    the following interval are passed on together at its end, so that
+    `fn` is called at most once per interval.
+
+    Delayed calls are scheduled with `call_later` on the running
+    asyncio event loop, if there is one, and otherwise run on a timer
+    thread. Coroutine functions are scheduled on the
+    param.parameterized.async_executor.
+    """
+
+    def __init__(self, fn, mode='args', debounce=None, throttle=None):
+        if debounce is not None and throttle is not None:
+            raise ValueError("A watcher may be debounced or throttled, not both.")
+        interval = debounce if throttle is None else throttle
+        if interval is None or interval < 0:
+            raise ValueError("The debounce or throttle interval of a watcher "
+                             "must be a positive number of milliseconds, "
+                             "not %r." % interval)
+        self.fn = fn
+        self.mode = mode
+        self.debounce = throttle is None
+        self.interval = interval / 1000.
+        self._lock = threading.Lock()
+        self._pending = None  # Coalesced events (or values) of the burst
+        self._scheduled = None  # Pending timer (or asyncio TimerHandle)
+        self._deadline = None  # Time at which a debounced call is due
+        self._last_call = None  # Time of the last throttled call
+
+    def __call__(self, *events, **values):
+        now = _monotonic()
+        with self._lock:
+            if self._pending is None:
+                self._pending = OrderedDict()
+            if self.mode == 'args':
+                for event in events:
+                    key = (event.name, event.what)
+                    first = self._pending.get(key)
+                    if first is not None:
+                        event = Event(what=event.what, name=event.name, obj=event.obj,
+                                      cls=event.cls, old=first.old, new=event.new,
+                                      type=event.type)
+                    self._pending[key] = event
+            else:
+                self._pending.update(values)
+
+            if self.debounce:
+                self._deadline = now + self.interval
+                if self._scheduled is None:
+                    self._scheduled = self._schedule(self.interval)
+                return
+            elif self._scheduled is not None:
+                return
+            elapsed = None if self._last_call is None else now - self._last_call
+            if elapsed is not None and elapsed < self.interval:
+                self._scheduled = self._schedule(self.interval - elapsed)
+                return
+        self._flush()
+
+    def _schedule(self, delay):
+        asyncio = sys.modules.get('asyncio')
+        loop = None
+        if asyncio is not None:
+            try:
+                loop = asyncio.get_running_loop()
+            except (AttributeError, RuntimeError):
+                pass
+        if loop is not None:
+            return loop.call_later(delay, self._expire)
+        timer = threading.Timer(delay, self._expire)
+        timer.daemon = True
+        timer.start()
+        return timer
+
+    def _expire(self):
+        with self._lock:
+            if self.debounce:
+                remaining = self._deadline - _monotonic()
+                if remaining > 0:
+                    # Events occurred since the timer was started
+                    self._scheduled = self._schedule(remaining)
+                    return
+            self._scheduled = None
+        self._flush()
+
+    def _flush(self):
+        with self._lock:
+            pending, self._pending = self._pending, None
+            self._last_call = _monotonic()
+        if not pending:
+            return
+        if self.mode == 'args':
+            args, kwargs = tuple(pending.values()), {}
+        else:
+            args, kwargs = (), pending
+        fn = self.fn
+        if isinstance(fn, _WeakCallback):
+            fn = fn.resolve()
+            if fn is None:
+                return
+        if iscoroutinefunction(fn):
+            if async_executor is None:
+                raise RuntimeError("Could not execute %s coroutine function. "
+                                   "Please register a asynchronous executor on "
+                                   "param.parameterized.async_executor, which "
+                                   "schedules the function on an event loop." %
+                                   fn)
+            async_executor(partial(fn, *args, **kwargs))
+        else:
+            fn(*args, **kwargs)
+
+    @property
+    def alive(self):
+        return not isinstance(self.fn, _WeakCallback) or self.fn.alive
+
+    def cancel(self):
+        """Discards the events of the current burst without calling fn."""
+        with self._lock:
+            scheduled, self._scheduled = self._scheduled, None
+            self._pending = None
+        if scheduled is not None:
+            scheduled.cancel()
+
+    def __getstate__(self):
+        # Timers and pending events are not saved
+        return {'fn': self.fn, 'mode': self.mode, 'debounce': self.debounce,
+                'interval': self.interval}
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+        self._pending = self._scheduled = self._deadline = self._last_call = None
+
+    def __repr__(self):
+        return '%s(%r, %s=%r)' % (type(self).__name__, self.fn,
+                                  'debounce' if self.debounce else 'throttle',
+                                  self.interval * 1000)
+
+
+def _method_rate_limiter(obj, method_name, function):
+    """
+    Returns the _RateLimiter shared by the watchers calling the given
+    method of obj, if the method declares a debounce or throttle
+    interval in param.depends.
+    """
+    dinfo = getattr(function, '_dinfo', {})
+    debounce, throttle = dinfo.get('debounce'), dinfo.get('throttle')
+    if debounce is None and throttle is None:
+        return None
+    limiters = obj.__dict__.get('_rate__limiters')
+    if limiters is None:
+        limiters = {}
+        if isinstance(obj, type):
+            type.__setattr__(obj, '_rate__limiters', limiters)
+        else:
+            obj.__dict__['_rate__limiters'] = limiters
+    limiter = limiters.get(method_name)
+    if limiter is None:
+        if iscoroutinefunction(function):
+            from ._async import generate_caller
+            fn = generate_caller(function)
+        else:
+            def fn(*events):
+                return function()
+        limiter = limiters[method_name] = _RateLimiter(
+            fn, debounce=debounce, throttle=throttle)
+    return limiter
+
+
+class _WeakCallback(object):
+    """
+    Watcher callback referencing the object it is called on weakly,
+    so that registering the Watcher does not keep the object alive.
+    Once the object is gone the Watcher is removed when it is next
+    dispatched (see Parameters._execute_watcher).
+
+    The callback is either a function `func` called with the object
+    as first argument (as for a method bound to it), or, if `func` is
+    None, the (weakly referenced) object itself.
+    """
+
+    __slots__ = ['func', 'ref', '_watcher_name']
+
+    def __init__(self, func, obj=None):
+        if obj is None:
+            if inspect.ismethod(func):
+                func, obj = func.__func__, func.__self__
+            else:
+                func, obj = None, func
+        self.func = func
+        self.ref = weakref.ref(obj)
+
+    @classmethod
+    def wrap(cls, fn):
+        """Returns a _WeakCallback for fn, unless it already is one."""
+        return fn if isinstance(fn, cls) else cls(fn)
+
+    @property
+    def alive(self):
+        return self.ref() is not None
+
+    def resolve(self):
+        """Returns the callback, or None if the object is gone."""
+        obj = self.ref()
+        if obj is None or self.func is None:
+            return obj
+        return MethodType(self.func, obj)
+
+    def __call__(self, *args, **kwargs):
+        fn = self.resolve()
+        if fn is not None:
+            return fn(*args, **kwargs)
+
+    def __deepcopy__(self, memo):
+        # Copies refer to the copy of the object, if it is copied too
+        obj = self.ref()
+        if obj is None:
+            return self
+        copied = _WeakCallback(self.func, memo.get(id(obj), obj))
+        if hasattr(self, '_watcher_name'):
+            copied._watcher_name = self._watcher_name
+        return copied
+
+    def __repr__(self):
+        return '%s(%r, %r)' % (type(self).__name__, self.func, self.ref)
+
+
+class _Unhashable(object):
+    """Cache key of a result whose dependency values are unhashable."""
+
+
+class _MethodCache(object):
+    """
+    Cache of the results of a method of a Parameterized object,
+    declared with param.depends(..., cache=True).
+
+    Results are keyed on the values of the dependencies of the method
+    (see Parameters.method_dependencies). Watchers on the dependencies
+    mark the latest result as stale when one of them changes, so that
+    the key only has to be computed again then; if it is not hashable
+    the result is only kept until then. The dependencies are resolved
+    again when a subobject on the path to one of them is replaced.
+    """
+
+    __slots__ = ['obj', 'name', 'maxsize', 'ttl', 'entries', 'current',
+                 'generation', 'watchers']
+
+    def __init__(self, obj, name, maxsize=128, ttl=None):
+        self.obj = obj
+        self.name = name
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.entries = OrderedDict() # key -> (result, time stored)
+        self.current = None # Key of the latest result, unless stale
+        self.generation = 0 # Number of invalidations
+        self.watchers = None
+
+    @classmethod
+    def get(cls, obj, name, maxsize=128, ttl=None):
+        """Returns the cache of the named method of obj."""
+        caches = obj.__dict__.get('_depends__caches')
+        if caches is None:
+            caches = obj.__dict__['_depends__caches'] = {}
+        cache = caches.get(name)
+        if cache is None:
+            cache = caches[name] = cls(obj, name, maxsize, ttl)
+        return cache
+
+    def _watch(self):
+        grouped = OrderedDict()
+        for dep in self.obj.param.method_dependencies(self.name, intermediate=True):
+            owner = dep.inst if dep.inst is not None else dep.cls
+            names = grouped.setdefault((id(owner), dep.what), (owner, []))[1]
+            if dep.name not in names:
+                names.append(dep.name)
+        # Run before the watchers that may call the method again
+        self.watchers = [
+            owner.param._watch(self._invalidate, names, what, precedence=-2)
+            for (_, what), (owner, names) in grouped.items()
+        ]
+
+    def _unwatch(self):
+        for watcher in self.watchers or []:
+            (watcher.inst or watcher.cls).param.unwatch(watcher)
+        self.watchers = None
+
+    def _invalidate(self, *events):
+        if isinstance(self.current, _Unhashable):
+            self.entries.pop(self.current, None)
+        self.current = None
+        self.generation += 1
+        if any(isinstance(e.old, Parameterized) or isinstance(e.new, Parameterized)
+               for e in events if e.what == 'value'):
+            # A subobject was replaced; its parameters are no longer
+            # dependencies
+            self._unwatch()
+
+    def _key(self):
+        values = []
+        for dep in self.obj.param.method_dependencies(self.name, intermediate=True):
+            owner = dep.inst if dep.inst is not None else dep.cls
+            if dep.what == 'value':
+                values.append(getattr(owner, dep.name))
+            else:
+                values.append(getattr(owner.param[dep.name], dep.what))
+        key = tuple(values)
+        try:
+            hash(key)
+        except TypeError:
+            key = _Unhashable()
+        return key
+
+    def lookup(self):
+        """
+        Returns whether a valid result is cached, the result, and the
+        token with which to store the result otherwise.
+        """
+        if self.watchers is None:
+            self._watch()
+        key = self.current
+        if key is None:
+            key = self._key()
+        entry = self.entries.get(key)
+        if entry is not None:
+            result, stored = entry
+            if self.ttl is None or _monotonic() - stored < self.ttl:
+                self.entries[key] = self.entries.pop(key)
+                self.current = key
+                return True, result, None
+            del self.entries[key]
+        return False, None, (key, self.generation)
+
+    def store(self, token, result):
+        key, generation = token
+        self.entries[key] = (result, _monotonic())
+        if generation == self.generation:
+            self.current = key
+        while len(self.entries) > self.maxsize:
+            self.entries.popitem(last=False)
+
+
+class _DependsGraph(object):
+    """
+    Graph of the dependencies between the watched methods of a
+    Parameterized class (see param.depends), compiled from their
+    dependency specifications when first needed:
+
+    dependents: parameter name -> methods depending on the parameter,
+                either directly or through another method
+    edges:      method -> methods it has to run after, i.e. the
+                methods it depends on (directly or through methods
+                that are not watched), and the methods that have set
+                a parameter it depends on
+
+    Which parameters a method sets cannot be known from its
+    specification, so the edges of the latter kind are added as the
+    methods run (see _DependsScheduler.record_set).
+    """
+
+    def __init__(self, cls):
+        self.dependents = defaultdict(set)
+        self.edges = defaultdict(set)
+        self._upstream = {}
+        watched = [w[0] for w in cls.param._depends['watch']]
+        for name, queued, on_init, constant, dynamic in cls.param._depends['watch']:
+            for dep in constant:
+                if dep.inst is None and issubclass(cls, dep.cls):
+                    self.dependents[dep.name].add(name)
+            self._add_method_edges(cls, name, getattr(cls, name), watched, set())
+
+    def _add_method_edges(self, cls, name, method, watched, seen):
+        for spec in getattr(method, '_dinfo', {}).get('dependencies', ()):
+            if not isinstance(spec, basestring):
+                continue
+            obj, attr, _ = _parse_dependency_spec(spec)
+            dep = getattr(cls, attr, None) if obj is None else None
+            if dep is None or attr in cls.param or attr in seen:
+                continue
+            seen.add(attr)
+            if attr in watched and attr != name:
+                self.edges[name].add(attr)
+            self._add_method_edges(cls, name, dep, watched, seen)
+
+    def learn(self, method, parameter):
+        """Records that the method has set the given parameter."""
+        for dependent in self.dependents.get(parameter, ()):
+            if dependent != method and method not in self.edges[dependent]:
+                self.edges[dependent].add(method)
+                self._upstream = {}
+
+    def upstream(self, method):
+        """Returns the methods the given method transitively runs after."""
+        upstream = self._upstream.get(method)
+        if upstream is None:
+            upstream, stack = set(), [method]
+            while stack:
+                for m in self.edges.get(stack.pop(), ()):
+                    if m not in upstream:
+                        upstream.add(m)
+                        stack.append(m)
+            upstream.discard(method)
+            self._upstream[method] = upstream
+        return upstream
+
+
+def _depends_graph(cls):
+    """Returns the _DependsGraph of the Parameterized class."""
+    depends = cls.param._depends
+    graph = depends.get('graph')
+    if graph is None:
+        graph = depends['graph'] = _DependsGraph(cls)
+    return graph
+
+
+class _DependsScheduler(threading.local):
+    """
+    Schedules the calls of the watched methods of Parameterized
+    objects (see param.depends) triggered while an event (or a batch
+    of events) is dispatched, so that each method runs at most once
+    and after the methods it depends on (see _DependsGraph).
+
+    Dispatching events opens a session, and the calls triggered while
+    a session is open are deferred: the outermost session runs them
+    before invoking the user watchers of the events (i.e. those with
+    a positive precedence) and again once they have been invoked.
+    The events queued by methods declared with watch='queued' are
+    dispatched once the scheduled calls have run.
+    """
+
+    def __init__(self):
+        self.depth = 0
+        self.pending = OrderedDict() # (id(obj), method name) -> call
+        self.running = []
+        self.queued = [] # Objects with events queued by running methods
+
+    def enter(self):
+        """Opens a session, returning whether it is the outermost one."""
+        self.depth += 1
+        return self.depth == 1
+
+    def exit(self):
+        self.depth -= 1
+        if not self.depth:
+            # Calls left by an error are dropped
+            self.pending.clear()
+            self.queued = []
+
+    def defer(self, obj, name, method, queued):
+        """
+        Schedules the call of the method of obj, returning False if no
+        session is open and the method should be called immediately.
+        """
+        if not self.depth:
+            return False
+        key = (id(obj), name)
+        if key not in self.pending:
+            self.pending[key] = (obj, name, method, queued)
+        return True
+
+    def record_set(self, obj, parameter):
+        """Records a parameter of obj set by a running method of obj."""
+        running_obj, method = self.running[-1]
+        if running_obj is obj:
+            _depends_graph(type(obj)).learn(method, parameter)
+
+    def _next(self):
+        pending = self.pending
+        if len(pending) == 1:
+            return next(iter(pending))
+        for key, (obj, name, _, _) in pending.items():
+            upstream = _depends_graph(type(obj)).upstream(name)
+            if not any((key[0], m) in pending for m in upstream):
+                return key
+        # Cyclic dependencies: run in the order of scheduling
+        return next(iter(pending))
+
+    def run(self):
+        """Runs the scheduled calls, including those they schedule."""
+        while self.pending:
+            obj, name, method, queued = self.pending.pop(self._next())
+            self.running.append((obj, name))
+            try:
+                if queued:
+                    if not any(o is obj for o in self.queued):
+                        self.queued.append(obj)
+                    with _batch_call_watchers(obj, run=False):
+                        method()
+                else:
+                    method()
+            finally:
+                self.running.pop()
+
+    def finish(self):
+        """
+        Runs the scheduled calls and dispatches the events queued by
+        them, until there are none left.
+        """
+        while self.pending or self.queued:
+            self.run()
+            queued, self.queued = self.queued, []
+            for obj in queued:
+                if not obj.param._BATCH_WATCH:
+                    obj.param._batch_call_watchers()
+
+
+_depends_scheduler = _DependsScheduler()
 
 
 class ParameterMetaclass(type):
@@ -970,7 +1985,7 @@ class Parameter(object):
     __slots__ = ['name', '_internal_name', 'default', 'doc',
                  'precedence', 'instantiate', 'constant', 'readonly',
                  'pickle_default_value', 'allow_None', 'per_instance',
-                 'watchers', 'owner', '_label']
+                 'watchers', 'owner', '_label', '_class_param']
 
     # Note: When initially created, a Parameter does not know which
     # Parameterized class owns it, nor does it know its names
@@ -1056,6 +2071,7 @@ class Parameter(object):
         class hierarchy (see ParameterizedMetaclass).
         """
 
+        self._class_param = None
         self.name = None
         self.owner = None
         self.precedence = precedence
@@ -1116,8 +2132,14 @@ class Parameter(object):
             raise AttributeError("Parameter name cannot be modified after "
                                  "it has been bound to a Parameterized.")
 
+        if attribute in _ParameterTable.summarized_slots:
+            owner = getattr(self, 'owner', None)
+            if (isinstance(owner, ParameterizedMetaclass) and
+                owner.__dict__.get(self.name) is self):
+                owner._clear_param_caches()
+
         implemented = (attribute != "default" and hasattr(self, 'watchers') and attribute in self.watchers)
-        slot_attribute = attribute in get_all_slots(type(self))
+        slot_attribute = attribute in _get_slots(type(self))[1]
         try:
             old = getattr(self, attribute) if implemented else NotImplemented
             if slot_attribute:
@@ -1135,13 +2157,26 @@ class Parameter(object):
         if old is NotImplemented:
             return
 
-        event = Event(what=attribute, name=self.name, obj=None, cls=self.owner,
-                      old=old, new=value, type=None)
+        event = _new_event(attribute, self.name, None, self.owner, old, value,
+                           self.owner.param._TRIGGER)
         for watcher in self.watchers[attribute]:
             self.owner.param._call_watcher(watcher, event)
         if not self.owner.param._BATCH_WATCH:
             self.owner.param._batch_call_watchers()
 
+    def __getattr__(self, attribute):
+        # Instance parameters only store the slots that have been set
+        # on them and fall back to the class parameter for the others
+        # (see Parameters.__getitem__)
+        try:
+            class_param = object.__getattribute__(self, '_class_param')
+        except AttributeError:
+            class_param = None
+        if class_param is None:
+            raise AttributeError("'%s' object has no attribute '%s'"
+                                 % (type(self).__name__, attribute))
+        return getattr(class_param, attribute)
+
     def _on_set(self, attribute, old, value):
         """
         Can be overridden on subclasses to handle changes when parameter
@@ -1164,6 +2199,11 @@ class Parameter(object):
             result = self.default
         else:
             result = obj.__dict__.get(self._internal_name,self.default)
+            if (self.instantiate and result is self.default and
+                '_instantiate__pending' in obj.__dict__):
+                # Instantiation was deferred (see lazy_instantiation)
+                obj.param._instantiate_pending(self.name)
+                result = obj.__dict__.get(self._internal_name,self.default)
         return result
 
     @instance_descriptor
@@ -1192,7 +2232,56 @@ class Parameter(object):
         object stored in a constant or read-only Parameter (e.g. one
         item in a list).
         """
+        val = self._validate_set(obj, val)
+        _old = self._store(obj, val)
+
+        if obj is not None:
+            if not getattr(obj, 'initialized', False):
+                return
+            if self.name in type(obj)._param._dynamic_deps:
+                if val is not _old:
+                    obj.param._update_deps(self.name)
+            elif self.name not in obj._param_watchers and not _broadcasting:
+                # Fast path: no dynamic dependency goes through this
+                # parameter and nothing watches it on the instance
+                return
+
+        watchers = self._value_watchers(obj)
+        obj = self.owner if obj is None else obj
 
+        if obj is None or not watchers:
+            return
+
+        event = _new_event('value', self.name, obj, self.owner, _old, val,
+                           obj.param._TRIGGER)
+        if obj.param._BATCH_WATCH and obj.param._coalesce_event(event):
+            return
+
+        if not isinstance(watchers, _WatcherList):
+            # Copy watchers here since they may be modified inplace during iteration
+            watchers = sorted(watchers, key=lambda w: w.precedence)
+        scheduler = _depends_scheduler
+        if scheduler.running:
+            scheduler.record_set(obj, self.name)
+        outermost = scheduler.enter()
+        try:
+            for watcher in watchers:
+                if outermost and watcher.precedence >= 0 and scheduler.pending:
+                    scheduler.run()
+                obj.param._call_watcher(watcher, event)
+            if outermost:
+                scheduler.finish()
+        finally:
+            scheduler.exit()
+        if not obj.param._BATCH_WATCH:
+            obj.param._batch_call_watchers()
+
+    def _validate_set(self, obj, val):
+        """
+        Checks that val may be set as the value of this Parameter on
+        obj (or on the owning class if obj is None) without setting
+        it, returning the value to be set.
+        """
         # PARAM2_DEPRECATION: For Python 2 compatibility only;
         # Deprecated Number set_hook called here to avoid duplicating setter
         if hasattr(self, 'set_hook'):
@@ -1200,58 +2289,49 @@ class Parameter(object):
 
         self._validate(val)
 
-        _old = NotImplemented
         # obj can be None if __set__ is called for a Parameterized class
-        if self.constant or self.readonly:
-            if self.readonly:
-                raise TypeError("Read-only parameter '%s' cannot be modified" % self.name)
-            elif obj is None:
-                _old = self.default
-                self.default = val
-            elif not obj.initialized:
-                _old = obj.__dict__.get(self._internal_name, self.default)
-                obj.__dict__[self._internal_name] = val
-            else:
-                _old = obj.__dict__.get(self._internal_name, self.default)
-                if val is not _old:
-                    raise TypeError("Constant parameter '%s' cannot be modified"%self.name)
-        else:
-            if obj is None:
-                _old = self.default
-                self.default = val
-            else:
-                _old = obj.__dict__.get(self._internal_name, self.default)
-                obj.__dict__[self._internal_name] = val
+        if self.readonly:
+            raise TypeError("Read-only parameter '%s' cannot be modified" % self.name)
+        elif (self.constant and obj is not None and obj.initialized and
+              val is not obj.__dict__.get(self._internal_name, self.default)):
+            raise TypeError("Constant parameter '%s' cannot be modified"%self.name)
+        return val
 
+    def _store(self, obj, val):
+        """
+        Stores a value of this Parameter that has been checked with
+        _validate_set, returning the previous value.
+        """
+        if obj is None:
+            _old = self.default
+            self.default = val
+        else:
+            _old = obj.__dict__.get(self._internal_name, self.default)
+            obj.__dict__[self._internal_name] = val
         self._post_setter(obj, val)
+        return _old
 
-        if obj is not None:
-            if not getattr(obj, 'initialized', False):
-                return
-            obj.param._update_deps(self.name)
-
+    def _value_watchers(self, obj):
+        """
+        Returns the watchers of the value of this Parameter on obj
+        (or on the owning class if obj is None), if any, including
+        those watching the instances of the class of obj.
+        """
         if obj is None:
-            watchers = self.watchers.get("value")
-        elif hasattr(obj, '_param_watchers') and self.name in obj._param_watchers:
+            return self.watchers.get("value")
+        watchers = None
+        if self.name in obj._param_watchers:
             watchers = obj._param_watchers[self.name].get('value')
             if watchers is None:
                 watchers = self.watchers.get("value")
-        else:
-            watchers = None
-
-        obj = self.owner if obj is None else obj
-
-        if obj is None or not watchers:
-            return
-
-        event = Event(what='value', name=self.name, obj=obj, cls=self.owner,
-                      old=_old, new=val, type=None)
-
-        # Copy watchers here since they may be modified inplace during iteration
-        for watcher in sorted(watchers, key=lambda w: w.precedence):
-            obj.param._call_watcher(watcher, event)
-        if not obj.param._BATCH_WATCH:
-            obj.param._batch_call_watchers()
+        if _broadcasting:
+            registries = type(obj)._get_param_table().broadcast.get(self.name)
+            if registries:
+                broadcast = [w for r in registries for w in r.matching(self.name, obj)]
+                if broadcast:
+                    watchers = sorted(list(watchers or ()) + broadcast,
+                                      key=lambda w: w.precedence)
+        return watchers
 
     def _validate_value(self, value, allow_None):
         """Implements validation for parameter value"""
@@ -1287,6 +2367,9 @@ class Parameter(object):
         state = {}
         for slot in get_occupied_slots(self):
             state[slot] = getattr(self,slot)
+        # Instance parameters are saved with all the slots they
+        # inherit from the class parameter
+        state.pop('_class_param', None)
         return state
 
     def __setstate__(self,state):
@@ -1303,6 +2386,8 @@ class Parameter(object):
             state['per_instance'] = False
         if '_label' not in state:
             state['_label'] = None
+        if '_class_param' not in state:
+            state['_class_param'] = None
 
         for (k,v) in state.items():
             setattr(self,k,v)
@@ -1389,6 +2474,48 @@ def as_uninitialized(fn):
     return override_initialization
 
 
+class _Equalities(dict):
+    """
+    Registry of the comparison functions of a Comparator, keyed by
+    type or by predicate function.
+
+    Caches the comparisons that may apply to each pair of object
+    types; the cache is cleared whenever the registry is modified.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super(_Equalities, self).__init__(*args, **kwargs)
+        self._dispatch = {}
+
+    def __setitem__(self, key, value):
+        super(_Equalities, self).__setitem__(key, value)
+        self._dispatch.clear()
+
+    def __delitem__(self, key):
+        super(_Equalities, self).__delitem__(key)
+        self._dispatch.clear()
+
+    def clear(self):
+        super(_Equalities, self).clear()
+        self._dispatch.clear()
+
+    def pop(self, *args):
+        self._dispatch.clear()
+        return super(_Equalities, self).pop(*args)
+
+    def popitem(self):
+        self._dispatch.clear()
+        return super(_Equalities, self).popitem()
+
+    def setdefault(self, key, default=None):
+        self._dispatch.clear()
+        return super(_Equalities, self).setdefault(key, default)
+
+    def update(self, *args, **kwargs):
+        super(_Equalities, self).update(*args, **kwargs)
+        self._dispatch.clear()
+
+
 class Comparator(object):
     """
     Comparator defines methods for determining whether two objects
@@ -1404,24 +2531,57 @@ class Comparator(object):
     applies. This is useful for defining comparisons for objects
     without explicitly importing them.
 
+    The comparisons that may apply to a pair of object types are
+    looked up once and cached until the equalities are modified. An
+    object is always considered equal to itself if a comparison is
+    registered for its type, without calling the comparison function.
+
+    Comparisons for large objects can avoid comparing elementwise by
+    using compare_array_buffer or hashed_comparison, e.g.:
+
+      Comparator.equalities[np.ndarray] = Comparator.compare_array_buffer
+
     To use the Comparator simply call the is_equal function.
     """
 
-    equalities = {
+    equalities = _Equalities({
         numbers.Number: operator.eq,
         basestring: operator.eq,
         bytes: operator.eq,
         type(None): operator.eq,
-    }
+    })
     equalities.update({dtt: operator.eq for dtt in dt_types})
 
     @classmethod
-    def is_equal(cls, obj1, obj2):
+    def _resolve_comparisons(cls, type1, type2):
+        """
+        Returns the (predicate, comparison) pairs that may apply to a
+        pair of objects of the given types, in registration order. The
+        predicate is None if the comparison was registered by type,
+        and is always the last entry in that case.
+        """
+        comparisons = []
         for eq_type, eq in cls.equalities.items():
-            if ((isinstance(eq_type, FunctionType)
-                 and eq_type(obj1) and eq_type(obj2))
-                or (isinstance(obj1, eq_type) and isinstance(obj2, eq_type))):
-                return eq(obj1, obj2)
+            if isinstance(eq_type, FunctionType):
+                comparisons.append((eq_type, eq))
+            elif issubclass(type1, eq_type) and issubclass(type2, eq_type):
+                comparisons.append((None, eq))
+                break
+        return tuple(comparisons)
+
+    @classmethod
+    def is_equal(cls, obj1, obj2):
+        dispatch = getattr(cls.equalities, '_dispatch', None)
+        types = (type(obj1), type(obj2))
+        if dispatch is None: # equalities replaced with a plain dict
+            comparisons = cls._resolve_comparisons(*types)
+        elif types in dispatch:
+            comparisons = dispatch[types]
+        else:
+            comparisons = dispatch[types] = cls._resolve_comparisons(*types)
+        for predicate, eq in comparisons:
+            if predicate is None or (predicate(obj1) and predicate(obj2)):
+                return obj1 is obj2 or eq(obj1, obj2)
         if isinstance(obj2, (list, set, tuple)):
             return cls.compare_iterator(obj1, obj2)
         elif isinstance(obj2, dict):
@@ -1448,6 +2608,41 @@ class Comparator(object):
                 return False
         return True
 
+    @staticmethod
+    def compare_array_buffer(obj1, obj2):
+        """
+        Compares objects supporting the array interface (such as NumPy
+        arrays) without comparing their elements: they are considered
+        equal if they are views of the same data buffer with the same
+        shape, dtype and strides. Note that in-place modifications of
+        the data are therefore not detected.
+        """
+        if obj1 is obj2:
+            return True
+        try:
+            info1, info2 = obj1.__array_interface__, obj2.__array_interface__
+        except AttributeError:
+            return False
+        return all(info1.get(k) == info2.get(k) for k in
+                   ('data', 'shape', 'typestr', 'descr', 'strides'))
+
+    @staticmethod
+    def hashed_comparison(hash_fn):
+        """
+        Returns a comparison function considering two objects equal if
+        hash_fn returns the same value for both. hash_fn should return
+        a value the Comparator can compare, such as an int or bytes,
+        e.g. to compare pandas objects:
+
+          Comparator.hashed_comparison(
+              lambda df: int(pd.util.hash_pandas_object(df).sum()))
+        """
+        def compare_hashes(obj1, obj2):
+            if obj1 is obj2:
+                return True
+            return Comparator.is_equal(hash_fn(obj1), hash_fn(obj2))
+        return compare_hashes
+
 
 class Parameters(object):
     """Object that holds the namespace and implementation of Parameterized
@@ -1459,6 +2654,12 @@ class Parameters(object):
     class or the instance as necessary.
     """
 
+    # Parameters objects are created for every Parameterized class and
+    # instance, so slots are used to keep them small; any state that
+    # has to be stored on the namespace must be declared here.
+    __slots__ = ['cls', 'self', '_parameters', '_depends', '_dynamic_deps',
+                 '_table', '_broadcast', '_doc']
+
     _disable_stubs = False # Flag used to disable stubs in the API1 tests
                           # None for no action, True to raise and False to warn.
 
@@ -1492,6 +2693,8 @@ class Parameters(object):
 
     @_events.setter
     def _events(self_, value):
+        if not isinstance(value, _EventQueue):
+            value = _EventQueue(value)
         self_.self_or_cls._parameters_state['events'] = value
 
     @property
@@ -1500,6 +2703,8 @@ class Parameters(object):
 
     @_watchers.setter
     def _watchers(self_, value):
+        if not isinstance(value, _WatcherQueue):
+            value = _WatcherQueue(value)
         self_.self_or_cls._parameters_state['watchers'] = value
 
     @property
@@ -1511,13 +2716,23 @@ class Parameters(object):
     def self_or_cls(self_):
         return self_.cls if self_.self is None else self_.self
 
+    def __getstate__(self):
+        """
+        Parameters objects have slots, not a dict, so we have to
+        support pickle and deepcopy ourselves.
+        """
+        return {slot: getattr(self, slot) for slot in Parameters.__slots__
+                if hasattr(self, slot)}
+
     def __setstate__(self, state):
         # Set old parameters state on Parameterized._parameters_state
-        self_or_cls = state.get('self', state.get('cls'))
+        self_or_cls = state.get('self')
+        if self_or_cls is None:
+            self_or_cls = state.get('cls')
         for k in self_or_cls._parameters_state:
             key = '_'+k
             if key in state:
-                self_or_cls._parameters_state[k] = state.pop(key)
+                setattr(self_or_cls.param, key, state.pop(key))
         for k, v in state.items():
             setattr(self, k, v)
 
@@ -1531,15 +2746,15 @@ class Parameters(object):
         if (inst is not None and getattr(inst, 'initialized', False) and p.per_instance and
             not getattr(inst, '_disable_instance__params', False)):
             if key not in inst._instance__params:
-                try:
-                    # Do not copy watchers on class parameter
-                    watchers = p.watchers
-                    p.watchers = {}
-                    p = copy.copy(p)
-                except:
-                    raise
-                finally:
-                    p.watchers = {k: list(v) for k, v in watchers.items()}
+                # Rather than a copy of the class parameter, create an
+                # instance parameter storing only the slots that are
+                # set on it, falling back to the class parameter for
+                # the others (see Parameter.__getattr__); the watchers
+                # of the class parameter are not inherited
+                class_param = p
+                p = type(class_param).__new__(type(class_param))
+                object.__setattr__(p, 'watchers', {})
+                object.__setattr__(p, '_class_param', class_param)
                 p.owner = inst
                 inst._instance__params[key] = p
             else:
@@ -1558,29 +2773,24 @@ class Parameters(object):
         """
         Iterates over the parameters on this object.
         """
-        for p in self_.objects(instance=False):
-            yield p
+        return iter(list(self_.cls._get_param_table().params))
 
 
     def __contains__(self_, param):
-        return param in list(self_)
+        return param in self_.cls._get_param_table().params
 
 
     def __getattr__(self_, attr):
         """
         Extends attribute access to parameter objects.
         """
-        cls = self_.__dict__.get('cls')
-        if cls is None: # Class not initialized
-            raise AttributeError
-
         try:
-            params = list(getattr(cls, '_%s__params' % cls.__name__))
-        except AttributeError:
-            params = [n for class_ in classlist(cls) for n, v in class_.__dict__.items()
-                      if isinstance(v, Parameter)]
+            # Avoid recursing into __getattr__ if the slot is unset
+            cls = object.__getattribute__(self_, 'cls')
+        except AttributeError: # Class not initialized
+            raise AttributeError(attr)
 
-        if attr in params:
+        if attr in cls._get_param_table().params:
             return self_.__getitem__(attr)
         elif self_.self is None:
             raise AttributeError("type object '%s.param' has no attribute %r" %
@@ -1618,19 +2828,14 @@ class Parameters(object):
         """
         self = self_.param.self
         ## Deepcopy all 'instantiate=True' parameters
-        # (building a set of names first to avoid redundantly
-        # instantiating a later-overridden parent class's parameter)
-        params_to_instantiate = {}
-        for class_ in classlist(type(self)):
-            if not issubclass(class_, Parameterized):
-                continue
-            for (k, v) in class_.param._parameters.items():
-                # (avoid replacing name with the default of None)
-                if v.instantiate and k != "name":
-                    params_to_instantiate[k] = v
-
-        for p in params_to_instantiate.values():
-            self.param._instantiate_param(p)
+        params_to_instantiate = type(self)._get_param_table().instantiate
+        if getattr(self, '_lazy_instantiate', False) and not shared_parameters._share:
+            # Defer instantiation to the first access of each value
+            if params_to_instantiate:
+                self._instantiate__pending = params_to_instantiate
+        else:
+            for p in params_to_instantiate.values():
+                self.param._instantiate_param(p)
 
         ## keyword arg setting
         for name, val in params.items():
@@ -1696,40 +2901,95 @@ class Parameters(object):
             # could instead have kept the same name
             new_object.param._generate_name()
 
+    def _instantiate_pending(self_, name=None):
+        """
+        Instantiates the values of the named parameter, or of all
+        parameters if no name is given, if their instantiation was
+        deferred (see lazy_instantiation).
+        """
+        self = self_.self
+        pending = self.__dict__.get('_instantiate__pending')
+        if not pending:
+            return
+        for p in (pending.values() if name is None else [pending.get(name)]):
+            if p is not None and p._internal_name not in self.__dict__:
+                self_._instantiate_param(p)
+
     def _update_deps(self_, attribute=None, init=False):
         obj = self_.self
         init_methods = []
-        for method, queued, on_init, constant, dynamic in type(obj).param._depends['watch']:
+        if init or attribute is None:
+            watch = type(obj).param._depends['watch']
+            constant_groups = type(obj).param._depends['constant']
+            attributes = None
+        elif isinstance(attribute, basestring):
+            # Only the dynamic dependencies going through the updated
+            # attribute (precomputed by the metaclass)
+            watch = type(obj).param._dynamic_deps.get(attribute, [])
+            attributes = (attribute,)
+        else:
+            # Several updated attributes; the dependencies of each
+            # method are merged so that its watchers are only
+            # rewired once
+            merged = OrderedDict()
+            for attr in attribute:
+                for method, queued, on_init, constant, dynamic in type(obj).param._dynamic_deps.get(attr, []):
+                    if method in merged:
+                        merged[method][4].extend(dynamic)
+                    else:
+                        merged[method] = (method, queued, on_init, constant, list(dynamic))
+            watch = list(merged.values())
+            attributes = attribute
+        for method, queued, on_init, constant, dynamic in watch:
             # On initialization set up constant watchers; otherwise
-            # clean up previous dynamic watchers for the updated attribute
-            dynamic = [d for d in dynamic if attribute is None or d.spec.split(".")[0] == attribute]
+            # rewire the dynamic watchers for the updated attributes
             if init:
-                constant_grouped = defaultdict(list)
-                for dep in _resolve_mcs_deps(obj, constant, []):
-                    constant_grouped[(id(dep.inst), id(dep.cls), dep.what)].append((None, dep))
-                for group in constant_grouped.values():
-                    self_._watch_group(obj, method, queued, group)
+                # Watchers on the parameters of the object itself,
+                # grouped by the metaclass
+                for owner, what, names in constant_groups[method]:
+                    mcaller = _m_caller(obj, method, what)
+                    (owner or obj).param._watch(
+                        mcaller, names, what, queued=queued, precedence=-1)
                 m = getattr(self_.self, method)
                 if on_init and m not in init_methods:
                     init_methods.append(m)
-            elif dynamic:
-                for w in obj._dynamic_watchers.pop(method, []):
-                    (w.inst or w.cls).param.unwatch(w)
-            else:
+            elif not dynamic:
                 continue
-
-            # Resolve dynamic dependencies one-by-one to be able to trace their watchers
-            grouped = defaultdict(list)
-            for ddep in dynamic:
-                for dep in _resolve_mcs_deps(obj, [], [ddep]):
-                    grouped[(id(dep.inst), id(dep.cls), dep.what)].append((ddep, dep))
-
-            for group in grouped.values():
-                watcher = self_._watch_group(obj, method, queued, group, attribute)
-                obj._dynamic_watchers[method].append(watcher)
+            self_._rewire_dynamic_deps(obj, method, queued, dynamic, attributes)
         for m in init_methods:
             m()
 
+    def _rewire_dynamic_deps(self_, obj, method, queued, dynamic, attributes=None):
+        """
+        Resolves the dynamic dependencies of a method and updates its
+        watchers on the subobjects incrementally: the watchers whose
+        specification is unchanged (i.e. those on the subobjects that
+        were not replaced) are kept, and only the watchers on replaced
+        subobjects are removed and created anew. The watchers are
+        indexed by the top-level attribute they go through, so that
+        only those through the given attributes are affected.
+        """
+        # Resolve dynamic dependencies one-by-one to be able to trace their watchers
+        grouped = OrderedDict()
+        for ddep in dynamic:
+            attr = ddep.spec.split(".")[0]
+            for dep in _resolve_mcs_deps(obj, [], [ddep]):
+                grouped.setdefault((attr, id(dep.inst), id(dep.cls), dep.what), []).append((ddep, dep))
+
+        specs = OrderedDict()
+        for (attr, _, _, _), group in grouped.items():
+            spec = self_._group_spec(obj, group, attr)
+            specs[spec[:-1]] = spec
+
+        watchers = obj._dynamic_watchers[method]
+        for key in list(watchers):
+            if (attributes is None or key[0] in attributes) and key not in specs:
+                w = watchers.pop(key)
+                (w.inst or w.cls).param.unwatch(w)
+        for key, spec in specs.items():
+            if key not in watchers:
+                watchers[key] = self_._watch_spec(obj, method, queued, spec)
+
     def _resolve_dynamic_deps(self, obj, dynamic_dep, param_dep, attribute):
         """
         If a subobject whose parameters are being depended on changes
@@ -1743,6 +3003,16 @@ class Parameters(object):
         reinitialized so we return a callback which updates the
         dependencies.
         """
+        subparams, nested, what = self._dynamic_dep_spec(
+            obj, dynamic_dep, param_dep)
+        return subparams, _update_deps_callback(obj, attribute) if nested else None, what
+
+    def _dynamic_dep_spec(self, obj, dynamic_dep, param_dep):
+        """
+        Returns the parameters to compare on a subobject change event
+        (see _resolve_dynamic_deps), whether the watched object is a
+        nested subobject and the parameter attribute depended on.
+        """
         subobj = obj
         subobjs = [obj]
         for subpath in dynamic_dep.spec.split('.')[:-1]:
@@ -1751,18 +3021,9 @@ class Parameters(object):
 
         dep_obj = (param_dep.inst or param_dep.cls)
         if dep_obj not in subobjs[:-1]:
-            return None, None, param_dep.what
+            return None, False, param_dep.what
 
         depth = subobjs.index(dep_obj)
-        callback = None
-        if depth > 0:
-            def callback(*events):
-                """
-                If a subobject changes, we need to notify the main
-                object to update the dependencies.
-                """
-                obj.param._update_deps(attribute)
-
         p = '.'.join(dynamic_dep.spec.split(':')[0].split('.')[depth+1:])
         if p == 'param':
             subparams = [sp for sp in list(subobjs[-1].param)]
@@ -1774,15 +3035,17 @@ class Parameters(object):
         else:
             what = param_dep.what
 
-        return subparams, callback, what
+        return subparams, depth > 0, what
 
-    def _watch_group(self_, obj, name, queued, group, attribute=None):
+    def _group_spec(self_, obj, group, attribute=None):
         """
-        Sets up a watcher for a group of dependencies. Ensures that
-        if the dependency was dynamically generated we check whether
-        a subobject change event actually causes a value change and
-        that we update the existing watchers, i.e. clean up watchers
-        on the old subobject and create watchers on the new subobject.
+        Returns the specification of the watcher for a group of
+        dependencies (see _watch_group), which identifies the watcher
+        while the watched subobject is not replaced:
+
+            (attribute, id(dep_obj), watched parameter attribute,
+             parameter names, compared subparameters, caller what,
+             nested, dep_obj)
         """
         dynamic_dep, param_dep = group[0]
         dep_obj = (param_dep.inst or param_dep.cls)
@@ -1792,14 +3055,32 @@ class Parameters(object):
                 params.append(g.name)
 
         if dynamic_dep is None:
-            subparams, callback, what = None, None, param_dep.what
+            subparams, nested, what = None, False, param_dep.what
         else:
-            subparams, callback, what = self_._resolve_dynamic_deps(
-                obj, dynamic_dep, param_dep, attribute)
-
-        mcaller = _m_caller(obj, name, what, subparams, callback)
+            subparams, nested, what = self_._dynamic_dep_spec(
+                obj, dynamic_dep, param_dep)
+        return (attribute, id(dep_obj), param_dep.what, tuple(params),
+                None if subparams is None else tuple(subparams), what,
+                nested, dep_obj)
+
+    def _watch_spec(self_, obj, name, queued, spec):
+        """Sets up the watcher specified by _group_spec."""
+        attribute, _, watched, params, subparams, what, nested, dep_obj = spec
+        callback = _update_deps_callback(obj, attribute) if nested else None
+        mcaller = _m_caller(obj, name, what, None if subparams is None else list(subparams), callback)
         return dep_obj.param._watch(
-            mcaller, params, param_dep.what, queued=queued, precedence=-1)
+            mcaller, list(params), watched, queued=queued, precedence=-1)
+
+    def _watch_group(self_, obj, name, queued, group, attribute=None):
+        """
+        Sets up a watcher for a group of dependencies. Ensures that
+        if the dependency was dynamically generated we check whether
+        a subobject change event actually causes a value change and
+        that we update the existing watchers, i.e. clean up watchers
+        on the old subobject and create watchers on the new subobject.
+        """
+        spec = self_._group_spec(obj, group, attribute)
+        return self_._watch_spec(obj, name, queued, spec)
 
     # Classmethods
 
@@ -1832,16 +3113,11 @@ class Parameters(object):
         """
         # Could have just done setattr(cls,param_name,param_obj),
         # which is supported by the metaclass's __setattr__ , but
-        # would need to handle the params() cache as well
-        # (which is tricky but important for startup speed).
+        # would need to handle the parameter tables as well.
         cls = self_.cls
         type.__setattr__(cls,param_name,param_obj)
         ParameterizedMetaclass._initialize_parameter(cls,param_name,param_obj)
-        # delete cached params()
-        try:
-            delattr(cls,'_%s__params'%cls.__name__)
-        except AttributeError:
-            pass
+        cls._clear_param_caches()
 
     # PARAM2_DEPRECATION: Backwards compatibilitity for param<1.12
     _add_parameter = add_parameter
@@ -1868,36 +3144,45 @@ class Parameters(object):
         """
         For the given dictionary or iterable or set of param=value keyword arguments,
         sets the corresponding parameter of this object or class to the given value.
+
+        On an instance all the values are validated before any of them
+        is set, so that either all or none of the parameters are
+        updated, and the watchers are called once with all the changes.
         """
-        BATCH_WATCH = self_.self_or_cls.param._BATCH_WATCH
-        self_.self_or_cls.param._BATCH_WATCH = True
         self_or_cls = self_.self_or_cls
         if args:
             if len(args) == 1 and not kwargs:
                 kwargs = args[0]
             else:
-                self_.self_or_cls.param._BATCH_WATCH = False
                 raise ValueError("%s.update accepts *either* an iterable or key=value pairs, not both" %
                                  (self_or_cls.name))
 
+        for k in kwargs:
+            if k not in self_or_cls.param:
+                raise ValueError("'%s' is not a parameter of %s" % (k, self_or_cls.name))
+
+        # (checked on the class parameters, to avoid creating
+        # instance parameters for all of the updated parameters)
+        params = self_.cls._get_param_table().params
         trigger_params = [k for k in kwargs
-                          if ((k in self_.self_or_cls.param) and
-                              hasattr(self_.self_or_cls.param[k], '_autotrigger_value'))]
+                          if hasattr(params[k], '_autotrigger_value')]
 
         for tp in trigger_params:
-            self_.self_or_cls.param[tp]._mode = 'set'
+            self_or_cls.param[tp]._mode = 'set'
 
-        for (k, v) in kwargs.items():
-            if k not in self_or_cls.param:
-                self_.self_or_cls.param._BATCH_WATCH = False
-                raise ValueError("'%s' is not a parameter of %s" % (k, self_or_cls.name))
-            try:
-                setattr(self_or_cls, k, v)
-            except:
-                self_.self_or_cls.param._BATCH_WATCH = False
-                raise
+        BATCH_WATCH = self_or_cls.param._BATCH_WATCH
+        self_or_cls.param._BATCH_WATCH = True
+        try:
+            if self_.self is None:
+                for (k, v) in kwargs.items():
+                    setattr(self_or_cls, k, v)
+            else:
+                self_._update_values(kwargs)
+        except:
+            self_or_cls.param._BATCH_WATCH = BATCH_WATCH
+            raise
 
-        self_.self_or_cls.param._BATCH_WATCH = BATCH_WATCH
+        self_or_cls.param._BATCH_WATCH = BATCH_WATCH
         if not BATCH_WATCH:
             self_._batch_call_watchers()
 
@@ -1908,6 +3193,55 @@ class Parameters(object):
             p._mode = 'set-reset'
 
 
+    def _update_values(self_, values):
+        """
+        Sets the given parameter values on the instance in bulk: all
+        the values are validated before any of them is stored, the
+        dynamic dependencies are updated once for all the changed
+        parameters and the events are queued as a single batch
+        (which must be enabled by the caller).
+        """
+        obj = self_.self
+        params = self_.cls._get_param_table().params
+        instance_params = getattr(obj, '_instance__params', {})
+
+        updates = []
+        for name, val in values.items():
+            p = instance_params.get(name, params[name])
+            if type(p).__set__ is Parameter.__set__:
+                updates.append((name, p, p._validate_set(obj, val)))
+            else:
+                # Parameters overriding __set__ are set individually
+                p._validate(val)
+                updates.append((name, None, val))
+
+        changes = []
+        for name, p, val in updates:
+            if p is None:
+                setattr(obj, name, val)
+            else:
+                changes.append((p, p._store(obj, val), val))
+
+        if not getattr(obj, 'initialized', False):
+            return
+
+        dynamic_deps = type(obj)._param._dynamic_deps
+        attributes = [p.name for p, old, val in changes
+                      if p.name in dynamic_deps and val is not old]
+        if attributes:
+            self_._update_deps(attributes)
+
+        for p, old, val in changes:
+            watchers = p._value_watchers(obj)
+            if not watchers:
+                continue
+            event = _new_event('value', p.name, obj, p.owner, old, val,
+                               self_._TRIGGER)
+            if self_._coalesce_event(event):
+                continue
+            for watcher in watchers:
+                self_._call_watcher(watcher, event)
+
     # PARAM2_DEPRECATION: Could be removed post param 2.0; use update() instead.
     def set_param(self_, *args,**kwargs):
         """
@@ -1942,23 +3276,10 @@ class Parameters(object):
         instance='existing'.
         """
         cls = self_.cls
-        # We cache the parameters because this method is called often,
-        # and parameters are rarely added (and cannot be deleted)
-        try:
-            pdict = getattr(cls, '_%s__params' % cls.__name__)
-        except AttributeError:
-            paramdict = {}
-            for class_ in classlist(cls):
-                for name, val in class_.__dict__.items():
-                    if isinstance(val, Parameter):
-                        paramdict[name] = val
-
-            # We only want the cache to be visible to the cls on which
-            # params() is called, so we mangle the name ourselves at
-            # runtime (if we were to mangle it now, it would be
-            # _Parameterized.__params for all classes).
-            setattr(cls, '_%s__params' % cls.__name__, paramdict)
-            pdict = paramdict
+        # The parameters are looked up in the table cached on the
+        # class because this method is called often, and parameters
+        # are rarely added (and cannot be deleted)
+        pdict = cls._get_param_table().params
 
         if instance and self_.self is not None:
             if instance == 'existing':
@@ -1993,53 +3314,162 @@ class Parameters(object):
         self_.set_param(**dict(params, **triggers))
         self_.self_or_cls.param._TRIGGER = False
         self_.self_or_cls.param._events += events
+        self_.self_or_cls.param._events.coalesce = getattr(events, 'coalesce', False)
         self_.self_or_cls.param._watchers += watchers
 
 
     def _update_event_type(self_, watcher, event, triggered):
         """
-        Returns an updated Event object with the type field set appropriately.
+        Returns an Event object with the type field set appropriately,
+        which is the supplied Event itself if it already has that type.
         """
         if triggered:
             event_type = 'triggered'
+        elif watcher.onlychanged:
+            event_type = 'changed'
         else:
-            event_type = 'changed' if watcher.onlychanged else 'set'
-        return Event(what=event.what, name=event.name, obj=event.obj, cls=event.cls,
-                     old=event.old, new=event.new, type=event_type)
+            event_type = 'set'
+        if event.type == event_type:
+            return event
+        return tuple.__new__(Event, event[:6] + (event_type,))
 
     def _execute_watcher(self, watcher, events):
+        fn = watcher.fn
+        if isinstance(fn, _WeakCallback):
+            fn = fn.resolve()
+            if fn is None:
+                # The weakly referenced callback is gone
+                self._prune_watcher(watcher)
+                return
+        elif isinstance(fn, _RateLimiter) and not fn.alive:
+            self._prune_watcher(watcher)
+            return
+
         if watcher.mode == 'args':
             args, kwargs = events, {}
         else:
             args, kwargs = (), {event.name: event.new for event in events}
 
-        if iscoroutinefunction(watcher.fn):
+        if iscoroutinefunction(fn):
             if async_executor is None:
                 raise RuntimeError("Could not execute %s coroutine function. "
                                    "Please register a asynchronous executor on "
                                    "param.parameterized.async_executor, which "
                                    "schedules the function on an event loop." %
-                                   watcher.fn)
-            async_executor(partial(watcher.fn, *args, **kwargs))
+                                   fn)
+            async_executor(partial(fn, *args, **kwargs))
+            return
+
+        executor = getattr(watcher, 'executor', None)
+        if executor is None:
+            executor = self.self_or_cls._param_executor
+        if executor is None:
+            executor = watcher_executor
+        if executor is None:
+            fn(*args, **kwargs)
         else:
-            watcher.fn(*args, **kwargs)
+            self._submit_watcher(executor, watcher, fn, args, kwargs)
+
+    def _prune_watcher(self_, watcher):
+        """
+        Removes a Watcher whose weakly referenced callback is gone
+        from the object or class it is registered on.
+        """
+        owner = watcher.cls if watcher.inst is None else watcher.inst
+        owner.param.unwatch(watcher)
+
+    def _submit_watcher(self_, executor, watcher, fn, args, kwargs):
+        """
+        Submits the call of a watcher to an executor, to be run in
+        order with the other calls submitted for this object (see
+        _ExecutorCalls).
+        """
+        self_or_cls = self_.self_or_cls
+        calls = self_or_cls.__dict__.get('_executor__calls')
+        if calls is None:
+            with _executor_calls_lock:
+                calls = self_or_cls.__dict__.get('_executor__calls')
+                if calls is None:
+                    calls = _ExecutorCalls()
+                    if isinstance(self_or_cls, type):
+                        type.__setattr__(self_or_cls, '_executor__calls', calls)
+                    else:
+                        self_or_cls.__dict__['_executor__calls'] = calls
+
+        if watcher.queued and not (ProcessPoolExecutor is not None and
+                                   isinstance(executor, ProcessPoolExecutor)):
+            # (In another process fn runs on copies of the arguments)
+            watcher_fn = fn
+            def fn(*args, **kwargs):
+                with _batch_call_watchers(self_or_cls):
+                    watcher_fn(*args, **kwargs)
+        calls.submit(executor, watcher, fn, args, kwargs)
+
+    def set_watcher_executor(self_, executor):
+        """
+        Sets the executor (e.g. a concurrent.futures.ThreadPoolExecutor)
+        on which to run the synchronous watchers of this object or
+        class that do not declare their own executor, or None to run
+        them in the thread that triggers them (or on the global
+        param.parameterized.watcher_executor, if set).
+
+        See Parameters.watch for the semantics of watchers run on an
+        executor.
+        """
+        self_or_cls = self_.self_or_cls
+        if isinstance(self_or_cls, type):
+            type.__setattr__(self_or_cls, '_param_executor', executor)
+        else:
+            self_or_cls.__dict__['_param_executor'] = executor
+
+    def join_watchers(self_, timeout=None):
+        """
+        Waits until the watchers of this object or class submitted to
+        executors have finished running, raising the first exception
+        raised by any of them since the last join. Returns False if
+        they did not finish within the given timeout (in seconds).
+
+        Must not be called from a watcher running on an executor.
+        """
+        calls = self_.self_or_cls.__dict__.get('_executor__calls')
+        if calls is None:
+            return True
+        return calls.join(timeout)
+
+    def _coalesce_event(self_, event):
+        """
+        Merges the event into the event queued for the same parameter
+        and `what` by a coalescing batch (see batch_call_watchers), if
+        any, in which case the watchers have been queued already and
+        True is returned.
+        """
+        events = self_._events
+        if events.coalesce and (event.name, event.what) in events.index:
+            events.append(event)
+            return True
+        return False
 
     def _call_watcher(self_, watcher, event):
         """
         Invoke the given watcher appropriately given an Event object.
         """
-        if self_.self_or_cls.param._TRIGGER:
+        self_or_cls = self_.self_or_cls
+        triggered = self_or_cls.param._TRIGGER
+        if triggered or not watcher.onlychanged:
             pass
-        elif watcher.onlychanged and (not self_._changed(event)):
+        elif self_or_cls.param._BATCH_WATCH and self_._events.coalesce:
+            # Whether the value changed is only decided once the
+            # coalesced event is dispatched
+            pass
+        elif not self_._changed(event):
             return
 
-        if self_.self_or_cls.param._BATCH_WATCH:
+        if self_or_cls.param._BATCH_WATCH:
             self_._events.append(event)
-            if not any(watcher is w for w in self_._watchers):
-                self_._watchers.append(watcher)
+            self_._watchers.append(watcher)
         else:
-            event = self_._update_event_type(watcher, event, self_.self_or_cls.param._TRIGGER)
-            with _batch_call_watchers(self_.self_or_cls, enable=watcher.queued, run=False):
+            event = self_._update_event_type(watcher, event, triggered)
+            with _batch_call_watchers(self_or_cls, enable=watcher.queued, run=False):
                 self_._execute_watcher(watcher, (event,))
 
     def _batch_call_watchers(self_):
@@ -2047,20 +3477,53 @@ class Parameters(object):
         Batch call a set of watchers based on the parameter value
         settings in kwargs using the queued Event and watcher objects.
         """
-        while self_.self_or_cls.param._events:
-            event_dict = OrderedDict([((event.name, event.what), event)
-                                      for event in self_.self_or_cls.param._events])
-            watchers = self_.self_or_cls.param._watchers[:]
-            self_.self_or_cls.param._events = []
-            self_.self_or_cls.param._watchers = []
-
-            for watcher in sorted(watchers, key=lambda w: w.precedence):
-                events = [self_._update_event_type(watcher, event_dict[(name, watcher.what)],
-                                                   self_.self_or_cls.param._TRIGGER)
-                          for name in watcher.parameter_names
-                          if (name, watcher.what) in event_dict]
-                with _batch_call_watchers(self_.self_or_cls, enable=watcher.queued, run=False):
-                    self_._execute_watcher(watcher, events)
+        scheduler = _depends_scheduler
+        outermost = scheduler.enter()
+        try:
+            while self_.self_or_cls.param._events:
+                self_._dispatch_batch(outermost)
+        finally:
+            scheduler.exit()
+
+    def _dispatch_batch(self_, outermost):
+        """
+        Invokes the queued watchers with their queued events, running
+        the watched methods they schedule if this is the outermost
+        dispatch (see _DependsScheduler).
+        """
+        scheduler = _depends_scheduler
+        event_dict = self_.self_or_cls.param._events.index
+        coalesced = self_.self_or_cls.param._events.coalesce
+        watchers = self_.self_or_cls.param._watchers
+        self_.self_or_cls.param._events = _EventQueue()
+        self_.self_or_cls.param._watchers = _WatcherQueue()
+
+        # Events retyped for the watchers, shared between them
+        typed = {}
+        for watcher in sorted(watchers, key=lambda w: w.precedence):
+            what = watcher.what
+            triggered = self_.self_or_cls.param._TRIGGER
+            events = []
+            for name in watcher.parameter_names:
+                event = event_dict.get((name, what))
+                if event is None:
+                    continue
+                elif (coalesced and watcher.onlychanged and not triggered
+                      and not self_._changed(event)):
+                    continue
+                retyped = self_._update_event_type(watcher, event, triggered)
+                if retyped is not event:
+                    key = (name, what, retyped.type)
+                    retyped = typed.setdefault(key, retyped)
+                events.append(retyped)
+            if not events:
+                continue
+            if outermost and watcher.precedence >= 0 and scheduler.pending:
+                scheduler.run()
+            with _batch_call_watchers(self_.self_or_cls, enable=watcher.queued, run=False):
+                self_._execute_watcher(watcher, events)
+        if outermost:
+            scheduler.finish()
 
     def set_dynamic_time_fn(self_,time_fn,sublistattr=None):
         """
@@ -2215,6 +3678,8 @@ class Parameters(object):
         """
         cls_or_slf = self_.self_or_cls
         param_obj = cls_or_slf.param.objects('existing').get(name)
+        if self_.self is not None:
+            self_._instantiate_pending(name)
 
         if not param_obj:
             value = getattr(cls_or_slf,name)
@@ -2272,13 +3737,9 @@ class Parameters(object):
         returned as these are primarily useful for internal use to
         determine when a sub-object dependency has to be updated.
         """
-        method = getattr(self_.self_or_cls, name)
-        minfo = MInfo(cls=self_.cls, inst=self_.self, name=name,
-                      method=method)
-        deps, dynamic = _params_depended_on(
-            minfo, dynamic=False, intermediate=intermediate)
+        deps, dynamic = _method_depended_on(self_.cls, name, intermediate)
         if self_.self is None:
-            return deps
+            return list(deps)
         return _resolve_mcs_deps(
             self_.self, deps, dynamic, intermediate=intermediate)
 
@@ -2402,15 +3863,16 @@ class Parameters(object):
                 if parameter_name not in watchers:
                     watchers[parameter_name] = {}
                 if what not in watchers[parameter_name]:
-                    watchers[parameter_name][what] = []
+                    watchers[parameter_name][what] = _WatcherList()
                 getattr(watchers[parameter_name][what], action)(watcher)
             else:
                 watchers = self_[parameter_name].watchers
                 if what not in watchers:
-                    watchers[what] = []
+                    watchers[what] = _WatcherList()
                 getattr(watchers[what], action)(watcher)
 
-    def watch(self_, fn, parameter_names, what='value', onlychanged=True, queued=False, precedence=0):
+    def watch(self_, fn, parameter_names, what='value', onlychanged=True, queued=False, precedence=0,
+              executor=None, debounce=None, throttle=None, weak=False):
         """
         Register the given callback function `fn` to be invoked for
         events on the indicated parameters.
@@ -2439,6 +3901,35 @@ class Parameters(object):
         precedences are reserved for internal Watchers, i.e. those
         set up by param.depends.
 
+        `executor`: An executor (e.g. a concurrent.futures
+        ThreadPoolExecutor) on which to run `fn` rather than in the
+        thread that triggered it. If not given, the executor set with
+        `set_watcher_executor` on this object (or on its class) is
+        used, if any, and otherwise the global
+        param.parameterized.watcher_executor, if set. The calls of
+        the watchers of an object that run on executors are ordered:
+        each starts once the calls submitted before it have finished,
+        except that calls of different watchers with the same
+        precedence run concurrently. Events generated by a `queued`
+        watcher are dispatched when it returns. With a process pool
+        `fn` runs on copies of the Event objects. Use `join_watchers`
+        to wait for the calls to finish.
+
+        `debounce`, `throttle`: An interval in milliseconds over which
+        to coalesce bursts of events into a single call of `fn`, made
+        with one Event per parameter carrying the `old` value of the
+        first event and the `new` value of the last one. A debounced
+        `fn` is called once no event has occurred for `debounce`
+        milliseconds; a throttled `fn` is called for the first event
+        and then at most once every `throttle` milliseconds. The
+        delayed calls are made from the running asyncio event loop,
+        if any, and otherwise from a timer thread.
+
+        `weak`: If True, the Watcher only holds a weak reference to
+        `fn` (or, if `fn` is a bound method, to the object it is bound
+        to), so that watching does not keep it alive. Once it is gone
+        the Watcher is removed the next time it would be invoked.
+
         When the `fn` is called, it will be provided the relevant
         Event objects as positional arguments, which allows it to
         determine which of the possible triggering events occurred.
@@ -2451,31 +3942,54 @@ class Parameters(object):
             raise ValueError("User-defined watch callbacks must declare "
                              "a positive precedence. Negative precedences "
                              "are reserved for internal Watchers.")
-        return self_._watch(fn, parameter_names, what, onlychanged, queued, precedence)
-
-    def _watch(self_, fn, parameter_names, what='value', onlychanged=True, queued=False, precedence=-1):
+        if weak:
+            fn = _WeakCallback.wrap(fn)
+        if debounce is not None or throttle is not None:
+            fn = _RateLimiter(fn, 'args', debounce, throttle)
+        return self_._watch(fn, parameter_names, what, onlychanged, queued, precedence,
+                            executor)
+
+    def _watch(self_, fn, parameter_names, what='value', onlychanged=True, queued=False, precedence=-1,
+               executor=None):
         parameter_names = tuple(parameter_names) if isinstance(parameter_names, list) else (parameter_names,)
-        watcher = Watcher(inst=self_.self, cls=self_.cls, fn=fn, mode='args',
-                          onlychanged=onlychanged, parameter_names=parameter_names,
-                          what=what, queued=queued, precedence=precedence)
+        watcher = Watcher(self_.self, self_.cls, fn, 'args', onlychanged,
+                          parameter_names, what, queued, precedence, executor)
         self_._register_watcher('append', watcher, what)
         return watcher
 
     def unwatch(self_, watcher):
         """
-        Remove the given Watcher object (from `watch` or `watch_values`) from this object's list.
+        Remove the given Watcher object (from `watch`, `watch_values`
+        or `watch_instances`) from this object's list.
         """
+        registry = getattr(self_.cls._param, '_broadcast', None)
+        if self_.self is None and registry is not None:
+            try:
+                for name in watcher.parameter_names:
+                    registry.watchers[name].remove(watcher)
+            except (KeyError, ValueError):
+                pass
+            else:
+                registry.instances.pop(id(watcher), None)
+                self_.cls._clear_param_caches()
+                return
         try:
             self_._register_watcher('remove', watcher, what=watcher.what)
         except Exception:
             self_.warning('No such watcher {watcher} to remove.'.format(watcher=str(watcher)))
+            return
+        if isinstance(watcher.fn, _RateLimiter):
+            watcher.fn.cancel()
 
-    def watch_values(self_, fn, parameter_names, what='value', onlychanged=True, queued=False, precedence=0):
+    def watch_values(self_, fn, parameter_names, what='value', onlychanged=True, queued=False, precedence=0,
+                     executor=None, debounce=None, throttle=None, weak=False):
         """
         Easier-to-use version of `watch` specific to watching for changes in parameter values.
 
         Only allows `what` to be 'value', and invokes the callback `fn` using keyword
         arguments <param_name>=<new_value> rather than with a list of Event objects.
+        With `debounce` or `throttle`, `fn` is called with the latest
+        values of the parameters set during a burst of events.
         """
         if precedence < 0:
             raise ValueError("User-defined watch callbacks must declare "
@@ -2486,13 +4000,61 @@ class Parameters(object):
             parameter_names = tuple(parameter_names)
         else:
             parameter_names = (parameter_names,)
-        watcher = Watcher(inst=self_.self, cls=self_.cls, fn=fn,
-                          mode='kwargs', onlychanged=onlychanged,
-                          parameter_names=parameter_names, what=what,
-                          queued=queued, precedence=precedence)
+        if weak:
+            fn = _WeakCallback.wrap(fn)
+        if debounce is not None or throttle is not None:
+            fn = _RateLimiter(fn, 'kwargs', debounce, throttle)
+        watcher = Watcher(self_.self, self_.cls, fn, 'kwargs', onlychanged,
+                          parameter_names, what, queued, precedence, executor)
         self_._register_watcher('append', watcher, what)
         return watcher
 
+    def watch_instances(self_, fn, parameter_names, onlychanged=True, queued=False,
+                        precedence=0, instances=None, executor=None):
+        """
+        Register the given callback function `fn` to be invoked for
+        changes of the values of the indicated parameters on any
+        instance of this class (or of its subclasses), as if it had
+        been registered with `watch` on each of them.
+
+        Rather than being stored on every instance, the Watcher is
+        registered once on the class, which does not keep a reference
+        to the instances. If `instances` is given, `fn` is only
+        invoked for those instances, which are referenced weakly.
+
+        Must be called on the param namespace of a class; use
+        `unwatch` on the same namespace to remove the Watcher.
+        See `watch` for the other arguments.
+        """
+        global _broadcasting
+        if self_.self is not None:
+            raise TypeError("watch_instances must be called on the param namespace "
+                            "of a Parameterized class, not of an instance.")
+        if precedence < 0:
+            raise ValueError("User-defined watch callbacks must declare "
+                             "a positive precedence. Negative precedences "
+                             "are reserved for internal Watchers.")
+        parameter_names = tuple(parameter_names) if isinstance(parameter_names, list) else (parameter_names,)
+        for name in parameter_names:
+            if name not in self_:
+                raise ValueError("%s parameter was not found in list of "
+                                 "parameters of class %s" %
+                                 (name, self_.cls.__name__))
+        watcher = Watcher(None, self_.cls, fn, 'args', onlychanged,
+                          parameter_names, 'value', queued, precedence, executor)
+        registry = self_.cls._param._broadcast
+        if registry is None:
+            registry = self_.cls._param._broadcast = _BroadcastWatchers()
+        for name in parameter_names:
+            if name not in registry.watchers:
+                registry.watchers[name] = _WatcherList()
+            registry.watchers[name].append(watcher)
+        if instances is not None:
+            registry.instances[id(watcher)] = weakref.WeakSet(instances)
+        _broadcasting = True
+        self_.cls._clear_param_caches()
+        return watcher
+
     # Instance methods
 
     # PARAM2_DEPRECATION: Backwards compatibilitity for param<1.12
@@ -2606,6 +4168,182 @@ class Parameters(object):
 
 
 
+class _InstanceParameters(object):
+    """
+    Non-data descriptor providing the Parameters namespace of a
+    Parameterized instance.
+
+    The namespace is created on first access and cached in the
+    instance __dict__ (which takes precedence over a non-data
+    descriptor), so that the many internal obj.param lookups made
+    e.g. when setting a parameter do not allocate a new object. The
+    cached namespace is not part of the pickled state of the instance
+    (see Parameterized.__getstate__).
+    """
+
+    def __get__(self, obj, objtype=None):
+        if obj is None:
+            return self
+        namespace = Parameters(type(obj), self=obj)
+        obj.__dict__['param'] = namespace
+        return namespace
+
+
+class _BroadcastWatchers(object):
+    """
+    Watchers registered on a Parameterized class with
+    Parameters.watch_instances, which receive the value events of the
+    instances of the class (and of its subclasses). They are
+    dispatched from Parameter.__set__ through the _ParameterTable of
+    the class of the instance, without being registered on the
+    instances.
+
+    watchers:  name -> _WatcherList of the Watchers of that Parameter
+    instances: id(watcher) -> WeakSet of the instances that Watcher is
+               restricted to, if it does not watch all of them
+    """
+
+    __slots__ = ['watchers', 'instances']
+
+    def __init__(self):
+        self.watchers = {}
+        self.instances = {}
+
+    def matching(self, name, obj):
+        """Returns the Watchers of the named Parameter watching obj."""
+        watchers = self.watchers.get(name)
+        if not watchers:
+            return ()
+        elif not self.instances:
+            return list(watchers)
+        instances = self.instances
+        return [w for w in watchers
+                if id(w) not in instances or obj in instances[id(w)]]
+
+
+# Set once a Watcher has been registered with watch_instances, so that
+# setting parameters only looks for such Watchers if there may be any
+_broadcasting = False
+
+
+class _ParameterTable(object):
+    """
+    Table of the Parameters of a Parameterized class, including the
+    ones it inherits, so that looking Parameters up does not have to
+    walk the class hierarchy. Built by the metaclass and rebuilt only
+    after Parameters have been added to the class (or to one of its
+    superclasses), or after one of the summarized slots has changed
+    on a class Parameter.
+
+    params:  name -> most specific Parameter declared with that name
+    owners:  name -> class declaring that Parameter
+    ordered: names sorted by precedence (None sorting just after 0),
+             in declaration order for equal precedences; sorted on
+             first access
+    instantiate, constant, dynamic, per_instance: name -> Parameter,
+             for the Parameters with the corresponding flag set
+    broadcast: name -> _BroadcastWatchers of the classes whose
+             instance watchers (see Parameters.watch_instances) watch
+             that Parameter
+
+    The table is shared by all lookups and must not be modified. The
+    table of a class with a single Parameterized base is built from
+    the table of the base.
+    """
+
+    __slots__ = ['params', 'owners', '_ordered', 'instantiate', 'constant',
+                 'dynamic', 'per_instance', 'broadcast']
+
+    # Slots of Parameters whose values are summarized in the table
+    summarized_slots = ('instantiate', 'constant', 'per_instance', 'precedence')
+
+    def __init__(self, cls):
+        params, owners, instantiate = {}, {}, {}
+        broadcast = defaultdict(list)
+        base = cls.__bases__[0]
+        if len(cls.__bases__) != 1 or '_param' not in base.__dict__:
+            classes = classlist(cls)
+        else:
+            table = base._get_param_table()
+            params.update(table.params)
+            owners.update(table.owners)
+            instantiate.update(table.instantiate)
+            for name, registries in table.broadcast.items():
+                broadcast[name].extend(registries)
+            classes = [cls]
+        for class_ in classes:
+            parameterized = isinstance(class_, ParameterizedMetaclass)
+            registry = getattr(class_.__dict__.get('_param'), '_broadcast', None)
+            if registry is not None:
+                for name, watchers in registry.watchers.items():
+                    if watchers:
+                        broadcast[name].append(registry)
+            for name, val in class_.__dict__.items():
+                if not isinstance(val, Parameter):
+                    continue
+                params[name] = val
+                owners[name] = class_
+                # Only Parameterized classes instantiate their parameters
+                # (and avoid replacing name with the default of None)
+                if parameterized and val.instantiate and name != "name":
+                    instantiate[name] = val
+        self.params = params
+        self.owners = owners
+        self._ordered = None
+        self.instantiate = instantiate
+        self.constant = {n: p for n, p in params.items() if p.constant}
+        self.dynamic = {n: p for n, p in params.items()
+                        if hasattr(p, '_value_is_dynamic')}
+        self.per_instance = {n: p for n, p in params.items() if p.per_instance}
+        self.broadcast = {n: tuple(r) for n, r in broadcast.items()}
+
+    @property
+    def ordered(self):
+        if self._ordered is None:
+            params = self.params
+            self._ordered = sorted(params, key=lambda n: 1e-8 if params[n].precedence is None
+                                   else params[n].precedence)
+        return self._ordered
+
+
+class _ClassDocstring(object):
+    """
+    Descriptor of the __doc__ attribute of Parameterized classes.
+
+    The docstring of a class is generated (see docstring_signature
+    and docstring_describe_params) when it is first accessed rather
+    than when the class is created, and cached on the class; the
+    docstring declared in the class body remains in its __dict__.
+    Setting __doc__ replaces the docstring altogether.
+    """
+
+    __slots__ = ['doc']
+
+    def __init__(self, doc):
+        # Docstring of the metaclass itself
+        self.doc = doc
+
+    def __get__(self, cls, mcs=None):
+        if cls is None:
+            return self.doc
+        parameters = cls.__dict__.get('_param')
+        if parameters is None: # Class not yet initialized
+            return cls.__dict__.get('__doc__')
+        doc = parameters._doc
+        if doc is None:
+            doc = parameters._doc = cls._class_docstring()
+        return doc
+
+    def __set__(self, cls, doc):
+        _type_doc.__set__(cls, doc)
+        parameters = cls.__dict__.get('_param')
+        if parameters is not None:
+            parameters._doc = doc
+
+
+_type_doc = type.__dict__['__doc__']
+
+
 class ParameterizedMetaclass(type):
     """
     The metaclass of Parameterized (and all its descendents).
@@ -2646,10 +4384,14 @@ class ParameterizedMetaclass(type):
         mcs._parameters_state = {
             "BATCH_WATCH": False, # If true, Event and watcher objects are queued.
             "TRIGGER": False,
-            "events": [], # Queue of batched events
-            "watchers": [] # Queue of batched watchers
+            "events": _EventQueue(), # Queue of batched events
+            "watchers": _WatcherQueue() # Queue of batched watchers
         }
         mcs._param = Parameters(mcs)
+        mcs._param._table = None
+        mcs._param._broadcast = None
+        mcs._param._depends = None
+        mcs._param._doc = None
 
         # All objects (with their names) of type Parameter that are
         # defined in this class
@@ -2691,8 +4433,48 @@ class ParameterizedMetaclass(type):
 
         mcs.param._depends = {'watch': _inherited+_watch}
 
+        # Group the constant dependencies of the watched methods by
+        # the object owning them and the parameter attribute, once
+        # per class; dependencies on parameters of the class are bound
+        # to each instance by Parameters._update_deps
+        constant_groups = {}
+        for method, queued, on_init, constant, dynamic in mcs.param._depends['watch']:
+            grouped = OrderedDict()
+            for dep in constant:
+                owner = None if (dep.inst is None and issubclass(mcs, dep.cls)) else (dep.inst or dep.cls)
+                names = grouped.setdefault((id(owner), id(dep.cls), dep.what), (owner, dep.what, []))[2]
+                if dep.name not in names:
+                    names.append(dep.name)
+            constant_groups[method] = list(grouped.values())
+        mcs.param._depends['constant'] = constant_groups
+
+        # Index the dynamic (sub-object) dependencies by the top-level
+        # attribute they go through, so that setting a parameter only
+        # has to update the watchers of the methods affected by it.
+        _dynamic_deps = defaultdict(list)
+        for method, queued, on_init, constant, dynamic in mcs.param._depends['watch']:
+            by_attribute = defaultdict(list)
+            for d in dynamic:
+                by_attribute[d.spec.split(".")[0]].append(d)
+            for attribute, attr_dynamic in by_attribute.items():
+                _dynamic_deps[attribute].append(
+                    (method, queued, on_init, constant, attr_dynamic))
+        mcs.param._dynamic_deps = dict(_dynamic_deps)
+
+        mcs._get_param_table()
+
+    # Class docstrings are generated lazily (the metaclass docstring
+    # is kept by the descriptor)
+    __doc__ = _ClassDocstring(__doc__)
+
+    def _class_docstring(mcs):
+        """
+        Returns the docstring of the class, which includes a keyword
+        signature if docstring_signature is set.
+        """
         if docstring_signature:
-            mcs.__class_docstring_signature()
+            return mcs.__class_docstring_signature()
+        return mcs.__dict__.get('__doc__')
 
     def __class_docstring_signature(mcs, max_repr_len=15):
         """
@@ -2714,10 +4496,11 @@ class ParameterizedMetaclass(type):
             keyword_groups.append(keyword_group)
 
         keywords = [el for grp in reversed(keyword_groups) for el in grp]
-        class_docstr = "\n"+mcs.__doc__ if mcs.__doc__ else ''
+        doc = mcs.__dict__.get('__doc__')
+        class_docstr = "\n"+doc if doc else ''
         signature = "params(%s)" % (", ".join(keywords))
         description = param_pager(mcs) if (docstring_describe_params and param_pager) else ''
-        mcs.__doc__ = signature + class_docstr + '\n' + description
+        return signature + class_docstr + '\n' + description
 
 
     def _initialize_parameter(mcs,param_name,param):
@@ -2726,6 +4509,34 @@ class ParameterizedMetaclass(type):
         param._set_names(param_name)
         mcs.__param_inheritance(param_name,param)
 
+    def _get_param_table(mcs):
+        """
+        Returns the _ParameterTable of this class, building it if it
+        has not been built yet or has been cleared.
+        """
+        table = mcs._param._table
+        if table is None:
+            table = mcs._param._table = _ParameterTable(mcs)
+        return table
+
+    def _clear_param_caches(mcs):
+        """
+        Clears the information about Parameters that is cached on
+        this class and its subclasses, to be recomputed when needed.
+        """
+        classes, seen = [mcs], set()
+        while classes:
+            cls = classes.pop()
+            if cls in seen:
+                continue
+            seen.add(cls)
+            if '_param' in cls.__dict__:
+                cls._param._table = None
+                depends = cls._param._depends
+                if depends:
+                    depends.pop('resolved', None)
+            classes.extend(type.__subclasses__(cls))
+
 
     # Should use the official Python 2.6+ abstract base classes; see
     # https://github.com/holoviz/param/issues/84
@@ -2780,6 +4591,7 @@ class ParameterizedMetaclass(type):
                 parameter = copy.copy(parameter)
                 parameter.owner = mcs
                 type.__setattr__(mcs,attribute_name,parameter)
+                mcs._clear_param_caches()
             mcs.__dict__[attribute_name].__set__(None,value)
 
         else:
@@ -2787,6 +4599,7 @@ class ParameterizedMetaclass(type):
 
             if isinstance(value,Parameter):
                 mcs.__param_inheritance(attribute_name,value)
+                mcs._clear_param_caches()
             elif isinstance(value,Parameters):
                 pass
             else:
@@ -2837,49 +4650,37 @@ class ParameterizedMetaclass(type):
         instantiate set to True, this parameter will inherit
         instantiate=True.
         """
-        # get all relevant slots (i.e. slots defined in all
-        # superclasses of this parameter)
-        slots = {}
-        for p_class in classlist(type(param))[1::]:
-            slots.update(dict.fromkeys(p_class.__slots__))
-
-
         # note for some eventual future: python 3.6+ descriptors grew
         # __set_name__, which could replace this and _set_names
         setattr(param,'owner',mcs)
-        del slots['owner']
 
         # backwards compatibility (see Composite parameter)
-        if 'objtype' in slots:
+        if 'objtype' in _get_slots(type(param))[1]:
             setattr(param,'objtype',mcs)
-            del slots['objtype']
-
-        # instantiate is handled specially
-        for superclass in classlist(mcs)[::-1]:
-            super_param = superclass.__dict__.get(param_name)
-            if isinstance(super_param, Parameter) and super_param.instantiate is True:
-                param.instantiate=True
-        del slots['instantiate']
-
 
-        for slot in slots.keys():
-            superclasses = iter(classlist(mcs)[::-1])
+        # Parameters with the same name up the hierarchy, looked up
+        # once for all the slots
+        super_params = [c.__dict__[param_name] for c in mcs.__mro__[1:]
+                        if c.__dict__.get(param_name) is not None]
+        if not super_params:
+            return
 
-            # Search up the hierarchy until param.slot (which has to
-            # be obtained using getattr(param,slot)) is not None, or
-            # we run out of classes to search.
-            while getattr(param,slot) is None:
-                try:
-                    param_super_class = next(superclasses)
-                except StopIteration:
-                    break
+        # instantiate is handled specially
+        if any(isinstance(super_param, Parameter) and super_param.instantiate is True
+               for super_param in super_params):
+            param.instantiate=True
 
-                new_param = param_super_class.__dict__.get(param_name)
-                if new_param is not None and hasattr(new_param,slot):
-                    # (slot might not be there because could be a more
-                    # general type of Parameter)
-                    new_value = getattr(new_param,slot)
+        for slot in _inherited_slots(type(param)):
+            if getattr(param,slot) is not None:
+                continue
+            # Search up the hierarchy for the first Parameter with a
+            # value for the slot (the slot might not be there because
+            # it could be a more general type of Parameter)
+            for super_param in super_params:
+                new_value = getattr(super_param,slot,None)
+                if new_value is not None:
                     setattr(param,slot,new_value)
+                    break
 
 
     def get_param_descriptor(mcs,param_name):
@@ -2889,8 +4690,13 @@ class ParameterizedMetaclass(type):
         one is found as a class attribute, that Parameter is returned
         along with the class in which it is declared.
         """
-        classes = classlist(mcs)
-        for c in classes[::-1]:
+        if mcs.__dict__.get('_param') is not None:
+            table = mcs._get_param_table()
+            if param_name in table.params:
+                return table.params[param_name],table.owners[param_name]
+            return None,None
+        # Class not yet initialized by the metaclass
+        for c in mcs.__mro__:
             attribute = c.__dict__.get(param_name)
             if isinstance(attribute,Parameter):
                 return attribute,c
@@ -3162,12 +4968,12 @@ class Parameterized(object):
         self._parameters_state = {
             "BATCH_WATCH": False, # If true, Event and watcher objects are queued.
             "TRIGGER": False,
-            "events": [], # Queue of batched events
-            "watchers": [] # Queue of batched watchers
+            "events": _EventQueue(), # Queue of batched events
+            "watchers": _WatcherQueue() # Queue of batched watchers
         }
         self._instance__params = {}
         self._param_watchers = {}
-        self._dynamic_watchers = defaultdict(list)
+        self._dynamic_watchers = defaultdict(OrderedDict)
 
         self.param._generate_name()
         self.param._setup_params(**params)
@@ -3177,9 +4983,11 @@ class Parameterized(object):
 
         self.initialized = True
 
-    @property
-    def param(self):
-        return Parameters(self.__class__, self=self)
+    param = _InstanceParameters()
+
+    # Executor running the watchers of the instances (see
+    # Parameters.set_watcher_executor)
+    _param_executor = None
 
     # 'Special' methods
 
@@ -3189,8 +4997,21 @@ class Parameterized(object):
         copy of the object's __dict__ and that also includes the
         object's __slots__ (if it has any).
         """
+        # Values whose instantiation was deferred are saved as if
+        # they had been instantiated on creation
+        self.param._instantiate_pending()
+
         # Unclear why this is a copy and not simply state.update(self.__dict__)
         state = self.__dict__.copy()
+        # The cached param namespace is recreated on demand
+        state.pop('param', None)
+        state.pop('_instantiate__pending', None)
+        # Executors, the calls running on them and the rate limiters of
+        # the watchers are not saved
+        state.pop('_param_executor', None)
+        state.pop('_executor__calls', None)
+        state.pop('_rate__limiters', None)
+        state.pop('_depends__caches', None)
         for slot in get_occupied_slots(self):
             state[slot] = getattr(self,slot)
 
@@ -3219,7 +5040,7 @@ class Parameterized(object):
                 for attr, watchers in attrs.items():
                     new_watchers = []
                     for watcher in watchers:
-                        watcher_args = list(watcher)
+                        watcher_args = list(watcher[:])
                         if watcher.inst is not None:
                             watcher_args[0] = self
                         fn = watcher.fn
@@ -3228,7 +5049,14 @@ class Parameterized(object):
                         elif get_method_owner(fn) is watcher.inst:
                             watcher_args[2] = getattr(self, fn.__name__)
                         new_watchers.append(Watcher(*watcher_args))
-                    param_watchers[p][attr] = new_watchers
+                    param_watchers[p][attr] = _WatcherList(new_watchers)
+
+        # Older versions queued batched events and watchers in lists
+        parameters_state = state.get('_parameters_state', {})
+        if not isinstance(parameters_state.get('events'), _EventQueue):
+            parameters_state['events'] = _EventQueue(parameters_state.get('events', []))
+        if not isinstance(parameters_state.get('watchers'), _WatcherQueue):
+            parameters_state['watchers'] = _WatcherQueue(parameters_state.get('watchers', []))
 
         if '_instance__params' not in state:
             state['_instance__params'] = {}
@@ -14,6 +14,8 @@ See https://github.com/holoviz/autover for more information.
 # source code, and the version was not necessarily PEP440 compliant.
 # Version.__new__ is added here to provide the previous Version class
 # (OldDeprecatedVersion) if Version is called in the old way.
+# get_cached_version is added here to avoid running git when importing
+# an installed package.
 
 
 __author__ = 'Jean-Luc Stevens'
@@ -534,6 +536,44 @@ def get_setupcfg_version():
     return get_setup_version(cfg,reponame=reponame,pkgname=pkgname,archive_commit=archive_commit)
 
 
+def get_cached_version(fpath, reponame, archive_commit=None):
+    """
+    Returns the version string of the package whose __init__.py is
+    fpath, i.e. str(Version(fpath=fpath, ...)), caching it as the
+    'version_string' entry of the .version file alongside fpath (the
+    entry written by Version.setup_version).
+
+    Unless the package is in the root directory of a git checkout,
+    the version cannot change, so the cached version is returned
+    without running git, and a version that had to be computed is
+    added to an existing .version file (if it is writable). In a
+    checkout the version is always obtained from git, as it changes
+    with every commit.
+    """
+    package_dir = os.path.dirname(os.path.abspath(fpath))
+    checkout = os.path.exists(os.path.join(os.path.dirname(package_dir), '.git'))
+    vfile = os.path.join(package_dir, '.version')
+    info = None
+    if not checkout:
+        try:
+            with open(vfile, 'r') as f:
+                info = json.loads(f.read())
+        except: # File may be missing if using pip + git archive
+            pass
+        if info and info.get('version_string'):
+            return info['version_string']
+
+    version = str(Version(fpath=fpath, reponame=reponame, archive_commit=archive_commit))
+    if isinstance(info, dict):
+        info['version_string'] = version
+        try:
+            with open(vfile, 'w') as f:
+                f.write(json.dumps(info))
+        except: # Read-only installation
+            pass
+    return version
+
+
 # from param/version.py aa087db29976d9b7e0f59c29789dfd721c85afd0
 class OldDeprecatedVersion(object):
     """
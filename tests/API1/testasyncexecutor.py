@@ -0,0 +1,162 @@
+"""
+Unit test for the asyncio executor of coroutine watchers
+"""
+import asyncio
+import threading
+
+import param
+
+from param import parameterized
+from param._async import AsyncExecutor
+
+from . import API1TestCase
+
+
+class AsyncExample(param.Parameterized):
+
+    a = param.Number(default=0)
+
+    b = param.Number(default=0)
+
+    c = param.Number(default=0)
+
+    @param.depends('b', watch=True)
+    async def _update_c(self):
+        await asyncio.sleep(0)
+        self.c = self.b
+
+
+class TestAsyncExecutor(API1TestCase):
+
+    def setUp(self):
+        super(TestAsyncExecutor, self).setUp()
+        self.loop = asyncio.new_event_loop()
+        self.executor = AsyncExecutor(self.loop)
+        parameterized.async_executor = self.executor
+
+    def tearDown(self):
+        parameterized.async_executor = None
+        self.loop.close()
+        super(TestAsyncExecutor, self).tearDown()
+
+    def run_settled(self):
+        async def settle():
+            await self.executor.settled()
+        self.loop.run_until_complete(settle())
+
+    def test_watcher_scheduled_on_loop(self):
+        obj = AsyncExample()
+        values = []
+        async def watcher(event):
+            values.append(event.new)
+        obj.param.watch(watcher, 'a')
+        obj.a = 1
+        self.assertEqual(values, [])
+        self.run_settled()
+        self.assertEqual(values, [1])
+        self.assertEqual(self.executor.pending, 0)
+
+    def test_depends_scheduled_on_loop(self):
+        obj = AsyncExample()
+        obj.b = 2
+        self.run_settled()
+        self.assertEqual(obj.c, 2)
+
+    def test_superseded_calls_coalesced(self):
+        obj = AsyncExample()
+        values = []
+        async def watcher(event):
+            await asyncio.sleep(0)
+            values.append(event.new)
+        obj.param.watch(watcher, 'a')
+        async def burst():
+            for i in range(1, 6):
+                obj.a = i
+            self.assertEqual(self.executor.pending, 2)
+            await self.executor.settled()
+        self.loop.run_until_complete(burst())
+        self.assertEqual(values, [1, 5])
+
+    def test_calls_not_coalesced(self):
+        self.executor.coalesce = False
+        obj = AsyncExample()
+        values = []
+        async def watcher(event):
+            await asyncio.sleep(0)
+            values.append(event.new)
+        obj.param.watch(watcher, 'a')
+        async def burst():
+            for i in range(1, 4):
+                obj.a = i
+            await self.executor.settled()
+        self.loop.run_until_complete(burst())
+        self.assertEqual(values, [1, 2, 3])
+
+    def test_bounded_concurrency(self):
+        self.executor.max_concurrency = 2
+        self.executor.coalesce = False
+        obj = AsyncExample()
+        running, peak = [0], [0]
+        async def watcher(event):
+            running[0] += 1
+            peak[0] = max(peak[0], running[0])
+            await asyncio.sleep(0.001)
+            running[0] -= 1
+        obj.param.watch(watcher, 'a')
+        async def burst():
+            for i in range(1, 10):
+                obj.a = i
+            await self.executor.settled()
+        self.loop.run_until_complete(burst())
+        self.assertEqual(peak[0], 2)
+
+    def test_watchers_tracked_separately(self):
+        obj = AsyncExample()
+        values = []
+        async def watcher_a(event):
+            await asyncio.sleep(0)
+            values.append(('a', event.new))
+        async def watcher_b(event):
+            await asyncio.sleep(0)
+            values.append(('b', event.new))
+        obj.param.watch(watcher_a, 'a')
+        obj.param.watch(watcher_b, 'a')
+        async def burst():
+            obj.a = 1
+            await self.executor.settled()
+        self.loop.run_until_complete(burst())
+        self.assertEqual(sorted(values), [('a', 1), ('b', 1)])
+
+    def test_settled_when_idle(self):
+        future = self.executor.settled()
+        self.assertTrue(future.done())
+
+    def test_errors_passed_to_loop(self):
+        errors = []
+        self.loop.set_exception_handler(lambda loop, context: errors.append(context))
+        obj = AsyncExample()
+        async def watcher(event):
+            raise RuntimeError('watcher failed')
+        obj.param.watch(watcher, 'a')
+        obj.a = 1
+        self.run_settled()
+        self.assertIsInstance(errors[0]['exception'], RuntimeError)
+
+    def test_submit_from_other_thread(self):
+        obj = AsyncExample()
+        values = []
+        async def watcher(event):
+            values.append(event.new)
+        obj.param.watch(watcher, 'a')
+        async def run():
+            thread = threading.Thread(target=setattr, args=(obj, 'a', 3))
+            thread.start()
+            thread.join()
+            await asyncio.sleep(0)
+            await self.executor.settled()
+        self.loop.run_until_complete(run())
+        self.assertEqual(values, [3])
+
+    def test_invalid_concurrency(self):
+        with self.assertRaises(ValueError):
+            AsyncExecutor(self.loop, max_concurrency=0)
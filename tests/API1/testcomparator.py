@@ -48,3 +48,97 @@ else:
 def test_comparator_equal(obj):
     assert Comparator.is_equal(obj, obj)
 
+
+
+class _Buffer(object):
+    "Minimal object exposing the array interface"
+
+    def __init__(self, data, shape=(3,), strides=None):
+        self.__array_interface__ = {
+            'data': (data, False), 'shape': shape, 'typestr': '<f8',
+            'descr': [('', '<f8')], 'strides': strides, 'version': 3
+        }
+
+    def __eq__(self, other):
+        raise AssertionError('Buffers should not be compared elementwise')
+
+
+class _Custom(object):
+    pass
+
+
+def test_comparator_identity_unregistered_type():
+    obj = _Custom()
+    assert not Comparator.is_equal(obj, obj)
+
+
+def test_comparator_dispatch_cached():
+    Comparator.is_equal(1, 2)
+    assert Comparator.equalities._dispatch[(int, int)]
+
+
+def test_comparator_dispatch_invalidated_on_register():
+    obj1, obj2 = _Custom(), _Custom()
+    assert not Comparator.is_equal(obj1, obj2)
+    Comparator.equalities[_Custom] = lambda o1, o2: True
+    try:
+        assert Comparator.is_equal(obj1, obj2)
+    finally:
+        del Comparator.equalities[_Custom]
+    assert not Comparator.is_equal(obj1, obj2)
+
+
+def test_comparator_predicate_evaluated_per_object():
+    def is_special(obj):
+        return getattr(obj, 'special', False)
+    obj1, obj2 = _Custom(), _Custom()
+    Comparator.equalities[is_special] = lambda o1, o2: True
+    try:
+        assert not Comparator.is_equal(obj1, obj2)
+        obj1.special = obj2.special = True
+        assert Comparator.is_equal(obj1, obj2)
+    finally:
+        del Comparator.equalities[is_special]
+
+
+def test_comparator_identity_short_circuit():
+    Comparator.equalities[_Buffer] = _Buffer.__eq__
+    try:
+        buf = _Buffer(1)
+        assert Comparator.is_equal(buf, buf)
+    finally:
+        del Comparator.equalities[_Buffer]
+
+
+def test_comparator_array_buffer():
+    Comparator.equalities[_Buffer] = Comparator.compare_array_buffer
+    try:
+        assert Comparator.is_equal(_Buffer(1), _Buffer(1))
+        assert not Comparator.is_equal(_Buffer(1), _Buffer(2))
+        assert not Comparator.is_equal(_Buffer(1), _Buffer(1, shape=(2,)))
+        assert not Comparator.is_equal(_Buffer(1), _Buffer(1, strides=(16,)))
+    finally:
+        del Comparator.equalities[_Buffer]
+
+
+def test_comparator_hashed_comparison():
+    Comparator.equalities[_Custom] = Comparator.hashed_comparison(lambda o: o.key)
+    try:
+        obj1, obj2, obj3 = _Custom(), _Custom(), _Custom()
+        obj1.key, obj2.key, obj3.key = 'a', 'a', 'b'
+        assert Comparator.is_equal(obj1, obj2)
+        assert not Comparator.is_equal(obj1, obj3)
+    finally:
+        del Comparator.equalities[_Custom]
+
+
+@pytest.mark.skipif(np is None, reason='NumPy is not available')
+def test_comparator_numpy_array_buffer():
+    Comparator.equalities[np.ndarray] = Comparator.compare_array_buffer
+    try:
+        arr = np.arange(3)
+        assert Comparator.is_equal(arr, arr[:])
+        assert not Comparator.is_equal(arr, arr.copy())
+        assert not Comparator.is_equal(arr, arr[::-1])
+    finally:
+        del Comparator.equalities[np.ndarray]
@@ -0,0 +1,173 @@
+"""
+Unit test for cached depends methods
+"""
+import asyncio
+import pickle
+import time
+
+import param
+
+from . import API1TestCase
+
+
+class CachedSub(param.Parameterized):
+
+    x = param.Number(default=1)
+
+
+class CachedExample(param.Parameterized):
+
+    a = param.Number(default=0)
+
+    b = param.List(default=[])
+
+    sub = param.ClassSelector(class_=CachedSub)
+
+    def __init__(self, **params):
+        self.calls = 0
+        super(CachedExample, self).__init__(**params)
+
+    @param.depends('a', cache=True)
+    def double(self):
+        self.calls += 1
+        return self.a * 2
+
+    @param.depends('b', cache=True)
+    def length(self):
+        self.calls += 1
+        return len(self.b)
+
+    @param.depends('sub.x', cache=True)
+    def sub_x(self):
+        self.calls += 1
+        return self.sub.x
+
+    @param.depends('a', cache=True, cache_size=2)
+    def small(self):
+        self.calls += 1
+        return self.a
+
+    @param.depends('a', cache=True, cache_ttl=0.05)
+    def expiring(self):
+        self.calls += 1
+        return self.a
+
+    @param.depends('a', cache=True)
+    def scaled(self, factor=1):
+        self.calls += 1
+        return self.a * factor
+
+
+class TestCachedDepends(API1TestCase):
+
+    def test_result_cached(self):
+        obj = CachedExample(a=2)
+        self.assertEqual(obj.double(), 4)
+        self.assertEqual(obj.double(), 4)
+        self.assertEqual(obj.calls, 1)
+
+    def test_invalidated_on_change(self):
+        obj = CachedExample(a=2)
+        obj.double()
+        obj.a = 3
+        self.assertEqual(obj.double(), 6)
+        self.assertEqual(obj.calls, 2)
+
+    def test_previous_values_cached(self):
+        obj = CachedExample(a=1)
+        obj.double()
+        obj.a = 2
+        obj.double()
+        obj.a = 1
+        self.assertEqual(obj.double(), 2)
+        self.assertEqual(obj.calls, 2)
+
+    def test_lru_eviction(self):
+        obj = CachedExample()
+        for a in (1, 2, 3, 1):
+            obj.a = a
+            obj.small()
+        self.assertEqual(obj.calls, 4)
+
+    def test_ttl(self):
+        obj = CachedExample(a=1)
+        obj.expiring()
+        obj.expiring()
+        self.assertEqual(obj.calls, 1)
+        time.sleep(0.06)
+        obj.expiring()
+        self.assertEqual(obj.calls, 2)
+
+    def test_unhashable_values(self):
+        obj = CachedExample(b=[1])
+        self.assertEqual(obj.length(), 1)
+        self.assertEqual(obj.length(), 1)
+        self.assertEqual(obj.calls, 1)
+        obj.b = [1, 2]
+        self.assertEqual(obj.length(), 2)
+        self.assertEqual(obj.calls, 2)
+
+    def test_arguments_bypass_cache(self):
+        obj = CachedExample(a=2)
+        self.assertEqual(obj.scaled(3), 6)
+        self.assertEqual(obj.scaled(3), 6)
+        self.assertEqual(obj.calls, 2)
+
+    def test_instances_cached_separately(self):
+        obj1, obj2 = CachedExample(a=1), CachedExample(a=2)
+        self.assertEqual(obj1.double(), 2)
+        self.assertEqual(obj2.double(), 4)
+
+    def test_subobject_dependency(self):
+        sub = CachedSub(x=1)
+        obj = CachedExample(sub=sub)
+        self.assertEqual(obj.sub_x(), 1)
+        sub.x = 2
+        self.assertEqual(obj.sub_x(), 2)
+        self.assertEqual(obj.calls, 2)
+
+    def test_subobject_replaced(self):
+        old = CachedSub(x=1)
+        obj = CachedExample(sub=old)
+        obj.sub_x()
+        obj.sub = CachedSub(x=3)
+        self.assertEqual(obj.sub_x(), 3)
+        old.x = 5
+        self.assertEqual(obj.sub_x(), 3)
+        obj.sub.x = 4
+        self.assertEqual(obj.sub_x(), 4)
+        self.assertEqual(obj.calls, 3)
+
+    def test_cache_not_pickled(self):
+        obj = CachedExample(a=2)
+        obj.double()
+        unpickled = pickle.loads(pickle.dumps(obj))
+        self.assertNotIn('_depends__caches', unpickled.__dict__)
+        self.assertEqual(unpickled.double(), 4)
+
+    def test_invalid_cache(self):
+        with self.assertRaises(ValueError):
+            param.depends('a', cache=True, cache_size=0)(lambda self: None)
+        obj = CachedSub()
+        with self.assertRaises(ValueError):
+            param.depends(obj.param.x, cache=True)(lambda x: x)
+
+    def test_async_cached(self):
+        class AsyncCached(param.Parameterized):
+            a = param.Number(default=1)
+            calls = 0
+            @param.depends('a', cache=True)
+            async def double(self):
+                self.calls += 1
+                await asyncio.sleep(0)
+                return self.a * 2
+        obj = AsyncCached()
+        loop = asyncio.new_event_loop()
+        try:
+            self.assertEqual(loop.run_until_complete(obj.double()), 2)
+            self.assertEqual(loop.run_until_complete(obj.double()), 2)
+            obj.a = 2
+            self.assertEqual(loop.run_until_complete(obj.double()), 4)
+        finally:
+            loop.close()
+        self.assertEqual(obj.calls, 2)
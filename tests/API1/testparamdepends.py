@@ -557,8 +557,10 @@ class TestParamDepends(API1TestCase):
 
         assert inst.nested_count == 1
 
+        # Runs once, after inst.b.single_parameter has updated
+        # inst.b.single_count
         inst.b.a = 1
-        assert inst.nested_count == 3
+        assert inst.nested_count == 2
 
     def test_param_instance_depends_dynamic_nested_initialized(self):
         init_b = self.P()
@@ -807,3 +809,188 @@ def test_misspelled_parameter_in_depends_watch():
             @param.depends("tlim", watch=True)  # <- Misspelled xlim
             def test(self):
                 return True
+
+
+class TestDependsScheduling(API1TestCase):
+
+    def test_diamond_runs_once(self):
+        class Diamond(param.Parameterized):
+            a = param.Integer()
+            b = param.Integer()
+            c = param.Integer()
+            calls = param.List()
+
+            @param.depends('a', watch=True)
+            def _set_b(self):
+                self.b = self.a + 1
+
+            @param.depends('a', watch=True)
+            def _set_c(self):
+                self.c = self.a + 2
+
+            @param.depends('b', 'c', watch=True)
+            def _combine(self):
+                self.calls.append((self.b, self.c))
+
+        obj = Diamond()
+        obj.a = 1
+        self.assertEqual(obj.calls, [(2, 3)])
+        obj.a = 2
+        self.assertEqual(obj.calls, [(2, 3), (3, 4)])
+
+    def test_order_learned_from_set_parameters(self):
+        class Learned(param.Parameterized):
+            a = param.Integer()
+            b = param.Integer()
+            calls = param.List()
+
+            @param.depends('a', 'b', watch=True)
+            def _combine(self):
+                self.calls.append((self.a, self.b))
+
+            @param.depends('a', watch=True)
+            def _set_b(self):
+                self.b = self.a * 10
+
+        obj = Learned()
+        obj.a = 1
+        obj.calls = []
+        obj.a = 2
+        self.assertEqual(obj.calls, [(2, 20)])
+
+    def test_method_dependency_runs_first(self):
+        class Chained(param.Parameterized):
+            a = param.Integer()
+            log = param.List()
+
+            @param.depends('_first', watch=True)
+            def _second(self):
+                self.log.append('second')
+
+            @param.depends('a', watch=True)
+            def _first(self):
+                self.log.append('first')
+
+        obj = Chained()
+        obj.a = 1
+        self.assertEqual(obj.log, ['first', 'second'])
+
+    def test_methods_run_before_user_watchers(self):
+        class Source(param.Parameterized):
+            a = param.Integer()
+            b = param.Integer()
+
+            @param.depends('a', watch=True)
+            def _set_b(self):
+                self.b = self.a * 2
+
+        obj = Source()
+        seen = []
+        obj.param.watch(lambda event: seen.append(obj.b), 'a')
+        obj.a = 2
+        self.assertEqual(seen, [4])
+
+    def test_batch_runs_method_once(self):
+        class Batched(param.Parameterized):
+            a = param.Integer()
+            b = param.Integer()
+            count = param.Integer()
+
+            @param.depends('a', watch=True)
+            def _set_b(self):
+                self.b = self.a
+
+            @param.depends('a', 'b', watch=True)
+            def _count(self):
+                self.count += 1
+
+        obj = Batched()
+        obj.param.update(a=1, b=5)
+        self.assertEqual(obj.count, 1)
+        self.assertEqual(obj.b, 1)
+
+    def test_error_clears_scheduled_calls(self):
+        class Failing(param.Parameterized):
+            a = param.Integer()
+            count = param.Integer()
+
+            @param.depends('a', watch=True)
+            def _fail(self):
+                raise RuntimeError('failed')
+
+            @param.depends('a', watch=True)
+            def _count(self):
+                self.count += 1
+
+        obj = Failing()
+        with self.assertRaises(RuntimeError):
+            obj.a = 1
+        self.assertEqual(param.parameterized._depends_scheduler.pending, {})
+        self.assertEqual(param.parameterized._depends_scheduler.depth, 0)
+
+
+class RewireSub(param.Parameterized):
+
+    x = param.Number(default=0)
+
+    y = param.Number(default=0)
+
+
+class RewireParent(param.Parameterized):
+
+    a = param.ClassSelector(class_=RewireSub)
+
+    b = param.ClassSelector(class_=RewireSub)
+
+    count = param.Integer(default=0)
+
+    @param.depends('a.x', 'b.y', watch=True)
+    def _count(self):
+        self.count += 1
+
+
+class TestDynamicDependencyRewiring(API1TestCase):
+
+    def test_other_attribute_watchers_kept(self):
+        obj = RewireParent(a=RewireSub(), b=RewireSub())
+        obj.a = RewireSub(x=1)
+        self.assertEqual(obj.count, 1)
+        obj.b.y = 1
+        self.assertEqual(obj.count, 2)
+
+    def test_only_replaced_subobject_watchers_moved(self):
+        obj = RewireParent(a=RewireSub(), b=RewireSub())
+        before = dict(obj._dynamic_watchers['_count'])
+        old = obj.a
+        obj.a = RewireSub(x=1)
+        after = obj._dynamic_watchers['_count']
+        moved = [k for k in before if k not in after]
+        self.assertEqual([before[k].inst for k in moved], [old])
+        for key, watcher in after.items():
+            if watcher.inst is not obj.a:
+                self.assertIs(watcher, before[key])
+        self.assertEqual(list(old._param_watchers['x']['value']), [])
+
+    def test_old_subobject_unwatched(self):
+        old = RewireSub()
+        obj = RewireParent(a=old)
+        obj.a = RewireSub()
+        old.x = 2
+        self.assertEqual(obj.count, 0)
+        obj.a.x = 3
+        self.assertEqual(obj.count, 1)
+
+    def test_same_subobject_not_rewired(self):
+        obj = RewireParent(a=RewireSub(), b=RewireSub())
+        before = dict(obj._dynamic_watchers['_count'])
+        obj.a = obj.a
+        self.assertEqual(dict(obj._dynamic_watchers['_count']), before)
+        self.assertEqual(obj.count, 0)
+
+    def test_bulk_update_rewires_both(self):
+        obj = RewireParent(a=RewireSub(), b=RewireSub())
+        obj.param.update(a=RewireSub(x=1), b=RewireSub(y=1))
+        self.assertEqual(obj.count, 1)
+        obj.a.x = 2
+        obj.b.y = 2
+        self.assertEqual(obj.count, 3)
@@ -0,0 +1,832 @@
+"""
+Microbenchmarks guarding the hot paths of Parameterized objects.
+
+These tests do not time anything that is sensitive to the machine
+they run on; instead they count the work (allocations, calls) that is
+performed per operation, so that regressions show up deterministically.
+"""
+import copy
+import importlib
+import os
+import pickle
+import shutil
+import sys
+import tempfile
+
+import param
+
+from param import parameterized
+from param.parameterized import Parameters, lazy_instantiation
+
+from . import API1TestCase
+
+
+class CountingParameters(object):
+    """
+    Context manager counting the Parameters namespace objects created
+    while it is active.
+    """
+
+    def __enter__(self):
+        self.count = 0
+        self._init = Parameters.__init__
+        def __init__(self_, *args, **kwargs):
+            self.count += 1
+            self._init(self_, *args, **kwargs)
+        Parameters.__init__ = __init__
+        return self
+
+    def __exit__(self, *args):
+        Parameters.__init__ = self._init
+
+
+class BenchmarkExample(param.Parameterized):
+
+    x = param.Number(default=0)
+
+    y = param.Number(default=0)
+
+    @param.depends('x', watch=True)
+    def _update_y(self):
+        self.y = self.x * 2
+
+
+class TestParamNamespace(API1TestCase):
+
+    def test_param_namespace_cached(self):
+        obj = BenchmarkExample()
+        self.assertIs(obj.param, obj.param)
+        self.assertIs(obj.param.self, obj)
+
+    def test_param_namespace_allocations_per_set(self):
+        obj = BenchmarkExample()
+        calls = []
+        obj.param.watch(calls.append, ['x', 'y'])
+        with CountingParameters() as counter:
+            for i in range(1, 1001):
+                obj.x = i
+        self.assertEqual(len(calls), 2000)
+        self.assertEqual(counter.count, 0)
+
+    def test_param_namespace_not_shared_by_copy(self):
+        obj = BenchmarkExample()
+        obj.x = 1
+        obj_copy = copy.copy(obj)
+        obj_deepcopy = copy.deepcopy(obj)
+        self.assertIs(obj_copy.param.self, obj_copy)
+        self.assertIs(obj_deepcopy.param.self, obj_deepcopy)
+        obj_deepcopy.x = 3
+        self.assertEqual(obj_deepcopy.y, 6)
+        self.assertEqual(obj.y, 2)
+
+    def test_param_namespace_not_pickled(self):
+        obj = param.Parameterized(name='pickled')
+        obj.param
+        self.assertNotIn('param', obj.__getstate__())
+        unpickled = pickle.loads(pickle.dumps(obj))
+        self.assertIs(unpickled.param.self, unpickled)
+        self.assertEqual(unpickled.name, 'pickled')
+
+    def test_param_namespace_setstate_discards_stale_namespace(self):
+        obj = BenchmarkExample()
+        other = BenchmarkExample()
+        state = dict(obj.__getstate__(), param=obj.param)
+        other.__setstate__(state)
+        self.assertIs(other.param.self, other)
+
+
+class PlainExample(param.Parameterized):
+
+    x = param.Number(default=0)
+
+
+class DynamicDependsExample(param.Parameterized):
+
+    sub = param.Parameter()
+
+    x = param.Number(default=0)
+
+    @param.depends('sub.x', watch=True)
+    def _sub_x(self):
+        pass
+
+
+class TestSetterFastPath(API1TestCase):
+
+    def setUp(self):
+        super(TestSetterFastPath, self).setUp()
+        self.calls = []
+        self._update_deps = Parameters._update_deps
+        def _update_deps(self_, *args, **kwargs):
+            if not kwargs.get('init'):
+                self.calls.append(args)
+            return self._update_deps(self_, *args, **kwargs)
+        Parameters._update_deps = _update_deps
+
+    def tearDown(self):
+        super(TestSetterFastPath, self).tearDown()
+        Parameters._update_deps = self._update_deps
+
+    def test_plain_set_skips_update_deps(self):
+        obj = PlainExample()
+        for i in range(100):
+            obj.x = i
+        self.assertEqual(obj.x, 99)
+        self.assertEqual(self.calls, [])
+
+    def test_watched_set_skips_update_deps(self):
+        obj = BenchmarkExample()
+        obj.x = 1
+        self.assertEqual(obj.y, 2)
+        self.assertEqual(self.calls, [])
+
+    def test_dynamic_dependencies_set_updates_deps(self):
+        obj = DynamicDependsExample()
+        obj.sub = PlainExample()
+        self.assertIn(('sub',), self.calls)
+
+    def test_unrelated_set_skips_update_deps(self):
+        obj = DynamicDependsExample(sub=PlainExample())
+        obj.x = 1
+        self.assertEqual(self.calls, [])
+
+    def test_dynamic_dependencies_indexed_by_attribute(self):
+        index = DynamicDependsExample.param._dynamic_deps
+        self.assertEqual(list(index), ['sub'])
+        [(method, _, _, _, dynamic)] = index['sub']
+        self.assertEqual(method, '_sub_x')
+        self.assertEqual([d.spec for d in dynamic], ['sub.x'])
+
+    def test_plain_set_still_validates(self):
+        obj = PlainExample()
+        with self.assertRaises(ValueError):
+            obj.x = 'not a number'
+        self.assertEqual(obj.x, 0)
+
+    def test_plain_set_dispatches_after_watch(self):
+        obj = PlainExample()
+        obj.x = 1
+        events = []
+        obj.param.watch(events.append, 'x')
+        obj.x = 2
+        self.assertEqual([(e.old, e.new) for e in events], [(1, 2)])
+
+
+class CountingCopy(list):
+    """List counting the deep copies made of it."""
+
+    copies = 0
+
+    def __deepcopy__(self, memo):
+        CountingCopy.copies += 1
+        return CountingCopy(copy.deepcopy(list(self), memo))
+
+
+@lazy_instantiation
+class LazyExample(param.Parameterized):
+
+    items = param.List(default=CountingCopy([1, 2]), class_=int, instantiate=True)
+
+    other = param.List(default=CountingCopy([3]), class_=int, instantiate=True)
+
+
+class TestLazyInstantiation(API1TestCase):
+
+    def setUp(self):
+        super(TestLazyInstantiation, self).setUp()
+        CountingCopy.copies = 0
+
+    def test_instantiation_deferred(self):
+        LazyExample()
+        self.assertEqual(CountingCopy.copies, 0)
+
+    def test_instantiated_on_first_access(self):
+        obj = LazyExample()
+        items = obj.items
+        self.assertEqual(items, [1, 2])
+        self.assertIsNot(items, LazyExample.items)
+        self.assertIs(obj.items, items)
+        self.assertEqual(CountingCopy.copies, 1)
+
+    def test_mutation_not_shared(self):
+        obj1, obj2 = LazyExample(), LazyExample()
+        obj1.items.append(3)
+        self.assertEqual(obj2.items, [1, 2])
+        self.assertEqual(LazyExample.items, [1, 2])
+
+    def test_set_before_access_skips_copy(self):
+        obj = LazyExample(items=[5])
+        obj.other = [6]
+        self.assertEqual((obj.items, obj.other), ([5], [6]))
+        self.assertEqual(CountingCopy.copies, 0)
+
+    def test_pickle_instantiates_pending(self):
+        obj = LazyExample()
+        state = obj.__getstate__()
+        self.assertNotIn('_instantiate__pending', state)
+        self.assertEqual(CountingCopy.copies, 2)
+        unpickled = pickle.loads(pickle.dumps(obj))
+        self.assertEqual(unpickled.items, [1, 2])
+
+    def test_shared_parameters_not_deferred(self):
+        with param.shared_parameters():
+            obj1, obj2 = LazyExample(), LazyExample()
+        self.assertIs(obj1.items, obj2.items)
+
+    def test_eager_by_default(self):
+        class EagerExample(param.Parameterized):
+            items = param.List(default=CountingCopy([1]), instantiate=True)
+        EagerExample()
+        self.assertEqual(CountingCopy.copies, 1)
+
+    def test_params_to_instantiate_precomputed(self):
+        self.assertEqual(sorted(LazyExample.param._table.instantiate),
+                         ['items', 'other'])
+
+    def test_params_to_instantiate_invalidated(self):
+        class A(param.Parameterized):
+            x = param.Parameter([1])
+        class B(A):
+            pass
+        self.assertEqual(list(B._get_param_table().instantiate), [])
+        A.param.x.instantiate = True
+        self.assertEqual(list(B._get_param_table().instantiate), ['x'])
+        A.param._add_parameter('y', param.Parameter([2], instantiate=True))
+        self.assertEqual(sorted(B._get_param_table().instantiate), ['x', 'y'])
+
+    def test_subclass_default_instantiated(self):
+        class A(param.Parameterized):
+            x = param.List([1], instantiate=True)
+        class B(A):
+            pass
+        B.x = [2]
+        self.assertEqual(B().x, [2])
+        self.assertEqual(A().x, [1])
+
+
+class TableBase(param.Parameterized):
+
+    a = param.Number(default=1, precedence=2)
+
+    b = param.List(default=[], constant=True)
+
+
+class TableChild(TableBase):
+
+    a = param.Number(default=2, per_instance=False)
+
+    c = param.Dynamic(default=0, precedence=1)
+
+
+class TestParameterTable(API1TestCase):
+
+    def setUp(self):
+        super(TestParameterTable, self).setUp()
+        self.walks = 0
+        self._classlist = parameterized.classlist
+        def classlist(class_):
+            self.walks += 1
+            return self._classlist(class_)
+        parameterized.classlist = classlist
+
+    def tearDown(self):
+        super(TestParameterTable, self).tearDown()
+        parameterized.classlist = self._classlist
+
+    def test_table_contents(self):
+        table = TableChild._get_param_table()
+        self.assertEqual(sorted(table.params), ['a', 'b', 'c', 'name'])
+        self.assertIs(table.params['a'], TableChild.__dict__['a'])
+        self.assertIs(table.owners['a'], TableChild)
+        self.assertIs(table.owners['b'], TableBase)
+        self.assertEqual(sorted(table.instantiate), ['b'])
+        self.assertEqual(sorted(table.constant), ['b', 'name'])
+        self.assertEqual(sorted(table.dynamic), ['a', 'c'])
+        self.assertNotIn('a', table.per_instance)
+        self.assertEqual(table.ordered[-2:], ['c', 'a'])
+
+    def test_lookups_do_not_walk_hierarchy(self):
+        obj = TableChild()
+        TableChild.param.objects()
+        obj.param.objects('existing')
+        with self.assertRaises(AttributeError):
+            obj.param.not_a_parameter
+        TableChild.get_param_descriptor('b')
+        obj.param.a
+        self.assertEqual(self.walks, 0)
+
+    def test_get_param_descriptor(self):
+        self.assertEqual(TableChild.get_param_descriptor('b'),
+                         (TableBase.param.b, TableBase))
+        self.assertEqual(TableChild.get_param_descriptor('d'), (None, None))
+
+    def test_table_invalidated_by_add_parameter(self):
+        class A(param.Parameterized):
+            pass
+        class B(A):
+            pass
+        B.param.objects()
+        A.param.add_parameter('x', param.Number(1))
+        self.assertIn('x', B.param.objects())
+        self.assertIs(B.get_param_descriptor('x')[1], A)
+
+    def test_table_invalidated_by_class_assignment(self):
+        class A(param.Parameterized):
+            x = param.Number(1)
+        class B(A):
+            pass
+        B.param.objects()
+        B.x = 2
+        self.assertIs(B.get_param_descriptor('x')[1], B)
+        self.assertEqual(B.param.objects()['x'].default, 2)
+        A.y = param.Number(3)
+        self.assertIn('y', B.param.objects())
+
+    def test_table_invalidated_by_flag_change(self):
+        class A(param.Parameterized):
+            x = param.Number(1)
+        class B(A):
+            pass
+        self.assertNotIn('x', B._get_param_table().constant)
+        A.param.x.constant = True
+        self.assertIn('x', B._get_param_table().constant)
+        A.param.x.precedence = -1
+        self.assertEqual(B._get_param_table().ordered[0], 'x')
+
+    def test_membership_does_not_walk_hierarchy(self):
+        obj = TableChild()
+        self.assertIn('b', obj.param)
+        self.assertNotIn('d', obj.param)
+        self.assertNotIn(1, TableChild.param)
+        self.assertEqual(sorted(obj.param), ['a', 'b', 'c', 'name'])
+        obj.param.watch(lambda *events: None, ['a', 'b'])
+        self.assertEqual(self.walks, 0)
+
+    def test_membership_after_add_parameter(self):
+        class A(param.Parameterized):
+            pass
+        obj = A()
+        self.assertNotIn('x', obj.param)
+        A.param.add_parameter('x', param.Number(1))
+        self.assertIn('x', obj.param)
+        self.assertIn('x', list(obj.param))
+
+
+class OverlayExample(param.Parameterized):
+
+    x = param.Number(default=1, bounds=(0, 10))
+
+    shared = param.Number(default=1, per_instance=False)
+
+
+class TestInstanceParameters(API1TestCase):
+
+    def test_instance_parameter_stores_only_set_slots(self):
+        obj = OverlayExample()
+        p = obj.param.x
+        self.assertIsNot(p, OverlayExample.param.x)
+        self.assertIsInstance(p, param.Number)
+        stored = []
+        for slot in parameterized.get_all_slots(type(p)):
+            try:
+                object.__getattribute__(p, slot)
+            except AttributeError:
+                continue
+            stored.append(slot)
+        self.assertEqual(sorted(stored), ['_class_param', 'owner', 'watchers'])
+        self.assertEqual((p.name, p.default, p.bounds), ('x', 1, (0, 10)))
+        self.assertIs(p.owner, obj)
+
+    def test_instance_parameter_slot_not_shared(self):
+        obj = OverlayExample()
+        obj.param.x.bounds = (0, 5)
+        self.assertEqual(OverlayExample.param.x.bounds, (0, 10))
+        self.assertEqual(OverlayExample().param.x.bounds, (0, 10))
+        with self.assertRaises(ValueError):
+            obj.x = 6
+        OverlayExample().x = 6
+
+    def test_instance_parameter_falls_back_to_class(self):
+        class A(param.Parameterized):
+            x = param.Number(default=1, bounds=(0, 10))
+        obj = A()
+        p = obj.param.x
+        A.param.x.bounds = (0, 2)
+        self.assertEqual(p.bounds, (0, 2))
+
+    def test_instance_parameter_watchers_not_inherited(self):
+        obj = OverlayExample()
+        events = []
+        watcher = OverlayExample.param.watch(events.append, 'x', what='bounds')
+        try:
+            obj.param.x.bounds = (0, 5)
+        finally:
+            OverlayExample.param.unwatch(watcher)
+        self.assertEqual(events, [])
+
+    def test_instance_parameter_pickled_with_all_slots(self):
+        obj = OverlayExample()
+        obj.param.x.bounds = (0, 5)
+        unpickled = pickle.loads(pickle.dumps(obj))
+        p = unpickled.param.x
+        self.assertIsNone(p._class_param)
+        self.assertEqual((p.bounds, p.default, p.name), ((0, 5), 1, 'x'))
+
+    def test_shared_parameter_not_overlaid(self):
+        obj = OverlayExample()
+        self.assertIs(obj.param.shared, OverlayExample.param.shared)
+
+    def test_missing_slot_raises(self):
+        with self.assertRaises(AttributeError):
+            OverlayExample.param.x.not_a_slot
+        with self.assertRaises(AttributeError):
+            OverlayExample().param.x.not_a_slot
+
+
+class BulkExample(param.Parameterized):
+
+    a = param.Number(default=0, bounds=(0, 10))
+
+    b = param.Number(default=0)
+
+    c = param.Parameter(default=None, constant=True)
+
+    sub1 = param.Parameter()
+
+    sub2 = param.Parameter()
+
+    @param.depends('sub1.x', 'sub2.x', watch=True)
+    def _subs(self):
+        self.b += 1
+
+
+class TestBulkUpdate(API1TestCase):
+
+    def test_update_sets_values(self):
+        obj = BulkExample()
+        obj.param.update(a=1, b=2)
+        self.assertEqual((obj.a, obj.b), (1, 2))
+
+    def test_update_validates_before_setting(self):
+        obj = BulkExample()
+        events = []
+        obj.param.watch(events.append, ['a', 'b'])
+        with self.assertRaises(ValueError):
+            obj.param.update(b=1, a=11)
+        self.assertEqual((obj.a, obj.b), (0, 0))
+        self.assertEqual(events, [])
+        self.assertFalse(obj.param._BATCH_WATCH)
+
+    def test_update_constant_before_setting(self):
+        obj = BulkExample()
+        with self.assertRaises(TypeError):
+            obj.param.update(a=1, c=1)
+        self.assertEqual(obj.a, 0)
+
+    def test_update_dispatches_one_batch(self):
+        obj = BulkExample()
+        calls = []
+        obj.param.watch(lambda *events: calls.append(events), ['a', 'b'])
+        obj.param.update(a=1, b=2)
+        self.assertEqual(len(calls), 1)
+        self.assertEqual([(e.name, e.old, e.new) for e in calls[0]],
+                         [('a', 0, 1), ('b', 0, 2)])
+
+    def test_update_dynamic_dependencies_once(self):
+        obj = BulkExample()
+        calls = []
+        update_deps = Parameters._update_deps
+        def _update_deps(self_, *args, **kwargs):
+            if not kwargs.get('init'):
+                calls.append(args)
+            return update_deps(self_, *args, **kwargs)
+        Parameters._update_deps = _update_deps
+        sub1, sub2 = PlainExample(), PlainExample()
+        try:
+            obj.param.update(sub1=sub1, sub2=sub2)
+        finally:
+            Parameters._update_deps = update_deps
+        self.assertEqual(calls, [(['sub1', 'sub2'],)])
+        b = obj.b
+        obj.sub1.x = 1
+        obj.sub2.x = 1
+        self.assertEqual(obj.b, b + 2)
+
+    def test_update_instance_parameter(self):
+        obj = BulkExample()
+        obj.param.a.bounds = (0, 1)
+        with self.assertRaises(ValueError):
+            obj.param.update(a=2)
+        BulkExample().param.update(a=2)
+
+    def test_update_dynamic_value(self):
+        obj = BulkExample()
+        values = iter(range(5, 10))
+        obj.param.update(b=lambda: next(values))
+        self.assertEqual(obj.b, 5)
+
+
+class TestBatchQueues(API1TestCase):
+
+    def test_watcher_queued_once(self):
+        obj = BulkExample()
+        calls = []
+        watcher = obj.param.watch(lambda *events: calls.append(events), ['a', 'b'])
+        with parameterized.batch_call_watchers(obj):
+            obj.a = 1
+            obj.b = 1
+            obj.a = 2
+            self.assertEqual(list(obj.param._watchers), [watcher])
+            self.assertEqual(sorted(obj.param._events.index),
+                             [('a', 'value'), ('b', 'value')])
+            self.assertEqual(obj.param._events.index[('a', 'value')].new, 2)
+        self.assertEqual(len(calls), 1)
+        self.assertEqual([(e.name, e.new) for e in calls[0]], [('a', 2), ('b', 1)])
+
+    def test_many_watchers_batched(self):
+        obj = BulkExample()
+        calls = []
+        for i in range(300):
+            obj.param.watch(lambda *events: calls.append(events), ['a'])
+        with parameterized.batch_call_watchers(obj):
+            obj.a = 1
+            obj.a = 2
+            self.assertEqual(len(obj.param._watchers), 300)
+        self.assertEqual(len(calls), 300)
+        self.assertEqual(obj.param._watchers, [])
+
+    def test_queues_replaced_with_lists(self):
+        obj = BulkExample()
+        calls = []
+        obj.param.watch(calls.append, ['a'])
+        obj.param._events = []
+        obj.param._watchers = []
+        with parameterized.batch_call_watchers(obj):
+            obj.a = 1
+        self.assertEqual(len(calls), 1)
+
+    def test_queues_restored_from_lists(self):
+        obj = BulkExample()
+        state = obj.__getstate__()
+        state['_parameters_state'] = dict(state['_parameters_state'],
+                                          events=[], watchers=[])
+        restored = BulkExample.__new__(BulkExample)
+        restored.__setstate__(state)
+        calls = []
+        restored.param.watch(calls.append, ['a'])
+        with parameterized.batch_call_watchers(restored):
+            restored.a = 1
+        self.assertEqual(len(calls), 1)
+
+
+class TestEventSharing(API1TestCase):
+
+    def test_event_shared_between_watchers(self):
+        obj = BulkExample()
+        events = []
+        obj.param.watch(events.append, ['a'])
+        obj.param.watch(events.append, ['a'])
+        obj.a = 1
+        self.assertEqual(len(events), 2)
+        self.assertIs(events[0], events[1])
+        self.assertEqual(events[0].type, 'changed')
+
+    def test_event_retyped_for_set_watchers(self):
+        obj = BulkExample()
+        changed, set_ = [], []
+        obj.param.watch(changed.append, ['a'])
+        obj.param.watch(set_.append, ['a'], onlychanged=False)
+        obj.a = 1
+        self.assertEqual(changed[0].type, 'changed')
+        self.assertEqual(set_[0].type, 'set')
+        self.assertEqual(set_[0][:6], changed[0][:6])
+
+    def test_retyped_event_shared_in_batch(self):
+        obj = BulkExample()
+        events = []
+        obj.param.watch(events.append, ['a'], onlychanged=False)
+        obj.param.watch(events.append, ['a'], onlychanged=False)
+        with parameterized.batch_call_watchers(obj):
+            obj.a = 1
+        self.assertEqual(events[0].type, 'set')
+        self.assertIs(events[0], events[1])
+
+    def test_triggered_event_type(self):
+        obj = BulkExample()
+        events = []
+        obj.param.watch(events.append, ['a'])
+        obj.param.trigger('a')
+        self.assertEqual(events[0].type, 'triggered')
+
+    def test_watcher_positional_construction(self):
+        fields = (None, BulkExample, print, 'args', True, ('a',), 'value', False)
+        watcher = parameterized.Watcher(*fields)
+        self.assertEqual(watcher.precedence, 0)
+        self.assertIsNone(watcher.executor)
+        self.assertEqual(watcher, parameterized.Watcher(*fields, precedence=0))
+        self.assertEqual(tuple(watcher), fields)
+
+
+class SpecExample(param.Parameterized):
+
+    a = param.Number(default=0)
+
+    b = param.Number(default=0)
+
+    c = param.Number(default=0, constant=True)
+
+    @param.depends('a', 'b', 'c:constant', watch=True)
+    def _update(self):
+        pass
+
+    @param.depends('_update', 'a')
+    def view(self):
+        pass
+
+
+class TestDependencySpecResolution(API1TestCase):
+
+    def setUp(self):
+        super(TestDependencySpecResolution, self).setUp()
+        self.parsed = []
+        self._parse_spec = parameterized._parse_spec
+        def _parse_spec(spec):
+            self.parsed.append(spec)
+            return self._parse_spec(spec)
+        parameterized._parse_spec = _parse_spec
+
+    def tearDown(self):
+        parameterized._parse_spec = self._parse_spec
+        super(TestDependencySpecResolution, self).tearDown()
+
+    def test_instances_do_not_parse_specs(self):
+        for _ in range(3):
+            SpecExample()
+        self.assertEqual(self.parsed, [])
+
+    def test_spec_parsed_once(self):
+        spec = 'x.y.unique_spec:constant'
+        parameterized._parse_dependency_spec(spec)
+        self.assertEqual(parameterized._parse_dependency_spec(spec),
+                         ('.x.y', 'unique_spec', 'constant'))
+        self.assertEqual(self.parsed, [spec])
+
+    def test_constant_watchers_grouped_by_class(self):
+        [(owner1, what1, names1), (owner2, what2, names2)] = \
+            SpecExample.param._depends['constant']['_update']
+        self.assertIsNone(owner1)
+        self.assertEqual((what1, names1), ('value', ['a', 'b']))
+        self.assertEqual((what2, names2), ('constant', ['c']))
+
+    def test_instance_watchers_bound(self):
+        obj = SpecExample()
+        [watcher] = obj._param_watchers['a']['value']
+        self.assertIs(watcher.inst, obj)
+        self.assertEqual(watcher.parameter_names, ('a', 'b'))
+
+    def test_method_dependencies_cached(self):
+        obj = SpecExample()
+        obj.param.method_dependencies('view')
+        del self.parsed[:]
+        deps = obj.param.method_dependencies('view')
+        self.assertEqual([(d.name, d.what) for d in deps],
+                         [('a', 'value'), ('b', 'value'), ('c', 'constant'), ('a', 'value')])
+        self.assertTrue(all(d.inst is obj for d in deps))
+        SpecExample.param.method_dependencies('view').append(None)
+        self.assertEqual(len(obj.param.method_dependencies('view')), 4)
+        self.assertEqual(self.parsed, [])
+
+
+def synthetic_hierarchy_source(n_classes=500, n_params=10):
+    """
+    Returns the source of a module declaring a hierarchy of n_classes
+    Parameterized classes, each overriding some Parameters of its
+    superclass and declaring a new one.
+    """
+    lines = ["import param", "", "class C0(param.Parameterized):"]
+    lines += ["    p%d = param.Number(default=%d, bounds=(0, None), doc='p%d')" % (i, i, i)
+              for i in range(n_params)]
+    for n in range(1, n_classes):
+        lines.append("class C%d(C%d):" % (n, max(0, n - 1 - (n % 7))))
+        lines += ["    p%d = param.Number(default=%d)" % ((n + i) % n_params, n)
+                  for i in range(3)]
+        lines.append("    q%d = param.String(default='q%d')" % (n, n))
+    return "\n".join(lines) + "\n"
+
+
+class TestClassCreation(API1TestCase):
+    """
+    Benchmark of the import of a module declaring a synthetic
+    hierarchy of 500 Parameterized classes.
+    """
+
+    def setUp(self):
+        super(TestClassCreation, self).setUp()
+        self.tmpdir = tempfile.mkdtemp()
+        self.module = 'param_synthetic_hierarchy'
+        with open(os.path.join(self.tmpdir, self.module + '.py'), 'w') as f:
+            f.write(synthetic_hierarchy_source())
+        sys.path.insert(0, self.tmpdir)
+        self.walks = 0
+        self._classlist = parameterized.classlist
+        def classlist(class_):
+            self.walks += 1
+            return self._classlist(class_)
+        parameterized.classlist = classlist
+
+    def tearDown(self):
+        parameterized.classlist = self._classlist
+        sys.path.remove(self.tmpdir)
+        sys.modules.pop(self.module, None)
+        shutil.rmtree(self.tmpdir)
+        super(TestClassCreation, self).tearDown()
+
+    def test_import_hierarchy(self):
+        module = importlib.import_module(self.module)
+        # One walk of the hierarchy per class (to collect the watched
+        # methods it inherits), none per Parameter or slot
+        self.assertLessEqual(self.walks, 510)
+        leaf = module.C499
+        self.assertEqual(leaf.param.p0.bounds, (0, None))
+        self.assertEqual(leaf.param.p0.doc, 'p0')
+        self.assertIn('q499', leaf.param)
+        self.assertIn('q496', leaf.param)
+
+    def test_tables_built_from_base(self):
+        module = importlib.import_module(self.module)
+        for cls in (module.C1, module.C250, module.C499):
+            table = cls._get_param_table()
+            expected = {}
+            for class_ in self._classlist(cls):
+                expected.update({n: p for n, p in class_.__dict__.items()
+                                 if isinstance(p, param.Parameter)})
+            self.assertEqual(table.params, expected)
+            self.assertEqual(list(table.params), list(expected))
+
+    def test_slots_computed_once_per_type(self):
+        parameterized.get_all_slots(param.Number)
+        self.walks = 0
+        parameterized.get_all_slots(param.Number)
+        self.assertEqual(self.walks, 0)
+        self.assertIs(parameterized._get_slots(param.Number),
+                      parameterized._get_slots(param.Number))
+        self.assertEqual(parameterized.get_all_slots(param.Number),
+                         [s for c in self._classlist(param.Number)[1:]
+                          for s in c.__slots__])
+
+
+class TestLazyClassDocstring(API1TestCase):
+
+    def setUp(self):
+        super(TestLazyClassDocstring, self).setUp()
+        self.rendered = []
+        self._param_pager = parameterized.param_pager
+        self._signature = parameterized.docstring_signature
+        self._describe = parameterized.docstring_describe_params
+        def param_pager(cls):
+            self.rendered.append(cls)
+            return 'description'
+        parameterized.param_pager = param_pager
+        parameterized.docstring_signature = True
+        parameterized.docstring_describe_params = True
+
+    def tearDown(self):
+        parameterized.param_pager = self._param_pager
+        parameterized.docstring_signature = self._signature
+        parameterized.docstring_describe_params = self._describe
+        super(TestLazyClassDocstring, self).tearDown()
+
+    def test_not_generated_on_class_creation(self):
+        class Documented(param.Parameterized):
+            """Documented class."""
+            x = param.Number(default=0)
+        self.assertEqual(self.rendered, [])
+        self.assertEqual(Documented.__dict__['__doc__'], 'Documented class.')
+
+    def test_generated_once_on_access(self):
+        class Documented(param.Parameterized):
+            """Documented class."""
+            x = param.Number(default=0)
+        doc = Documented.__doc__
+        self.assertEqual(doc, 'params(x=Number, name=String)\n'
+                         'Documented class.\ndescription')
+        self.assertIs(Documented.__doc__, doc)
+        self.assertEqual(self.rendered, [Documented])
+
+    def test_signature_disabled(self):
+        parameterized.docstring_signature = False
+        class Documented(param.Parameterized):
+            """Documented class."""
+        self.assertEqual(Documented.__doc__, 'Documented class.')
+        self.assertEqual(self.rendered, [])
+
+    def test_set_docstring(self):
+        class Documented(param.Parameterized):
+            """Documented class."""
+        Documented.__doc__ = 'Replaced.'
+        self.assertEqual(Documented.__doc__, 'Replaced.')
+        self.assertEqual(self.rendered, [])
+
+    def test_metaclass_docstring(self):
+        self.assertIn('The metaclass of Parameterized',
+                      parameterized.ParameterizedMetaclass.__doc__)
@@ -0,0 +1,157 @@
+"""
+Unit test for debounced and throttled watchers
+"""
+import asyncio
+import threading
+import time
+
+import param
+
+from param import parameterized
+from param._async import AsyncExecutor
+
+from . import API1TestCase
+
+
+class RateLimitExample(param.Parameterized):
+
+    a = param.Number(default=0)
+
+    b = param.Number(default=0)
+
+    def __init__(self, **params):
+        self.calls = []
+        self.called = threading.Event()
+        super(RateLimitExample, self).__init__(**params)
+
+    @param.depends('a', 'b', watch=True, debounce=20)
+    def _debounced(self):
+        self.calls.append((self.a, self.b))
+        self.called.set()
+
+
+class TestRateLimitedWatchers(API1TestCase):
+
+    def collect(self, obj, **kwargs):
+        events, called = [], threading.Event()
+        def watcher(*evts):
+            events.append(evts)
+            called.set()
+        watcher_obj = obj.param.watch(watcher, ['a', 'b'], **kwargs)
+        return events, called, watcher_obj
+
+    def test_debounce_coalesces_burst(self):
+        obj = RateLimitExample()
+        events, called, _ = self.collect(obj, debounce=20)
+        for i in range(1, 6):
+            obj.a = i
+        obj.b = 2
+        self.assertEqual(events, [])
+        self.assertTrue(called.wait(5))
+        [evts] = events
+        self.assertEqual([(e.name, e.old, e.new) for e in evts],
+                         [('a', 0, 5), ('b', 0, 2)])
+
+    def test_debounce_waits_for_quiet_period(self):
+        obj = RateLimitExample()
+        events, called, _ = self.collect(obj, debounce=100)
+        obj.a = 1
+        time.sleep(0.05)
+        obj.a = 2
+        time.sleep(0.06)
+        self.assertEqual(events, [])
+        self.assertTrue(called.wait(5))
+        self.assertEqual(events[0][0].new, 2)
+
+    def test_throttle_calls_first_event_immediately(self):
+        obj = RateLimitExample()
+        events, called, _ = self.collect(obj, throttle=30)
+        obj.a = 1
+        self.assertEqual(len(events), 1)
+        called.clear()
+        obj.a = 2
+        obj.a = 3
+        self.assertEqual(len(events), 1)
+        self.assertTrue(called.wait(5))
+        [e] = events[1]
+        self.assertEqual((e.old, e.new), (1, 3))
+
+    def test_watch_values_debounce(self):
+        obj = RateLimitExample()
+        values, called = [], threading.Event()
+        def watcher(**kwargs):
+            values.append(kwargs)
+            called.set()
+        obj.param.watch_values(watcher, ['a', 'b'], debounce=10)
+        obj.a = 1
+        obj.b = 2
+        obj.a = 3
+        self.assertTrue(called.wait(5))
+        self.assertEqual(values, [{'a': 3, 'b': 2}])
+
+    def test_depends_debounce(self):
+        obj = RateLimitExample()
+        obj.a = 1
+        obj.b = 2
+        obj.a = 3
+        self.assertEqual(obj.calls, [])
+        self.assertTrue(obj.called.wait(5))
+        self.assertEqual(obj.calls, [(3, 2)])
+
+    def test_depends_function_throttle(self):
+        obj = RateLimitExample()
+        calls = []
+        @param.depends(obj.param.a, obj.param.b, watch=True, throttle=1000)
+        def fn(a, b):
+            calls.append((a, b))
+        obj.a = 1
+        obj.b = 2
+        self.assertEqual(calls, [(1, 0)])
+
+    def test_unwatch_cancels_pending_call(self):
+        obj = RateLimitExample()
+        events, called, watcher = self.collect(obj, debounce=10)
+        obj.a = 1
+        obj.param.unwatch(watcher)
+        self.assertFalse(called.wait(0.05))
+
+    def test_debounce_and_throttle_exclusive(self):
+        obj = RateLimitExample()
+        with self.assertRaises(ValueError):
+            obj.param.watch(print, 'a', debounce=10, throttle=10)
+        with self.assertRaises(ValueError):
+            param.depends('a', debounce=10, throttle=10)(lambda self: None)
+
+    def test_negative_interval(self):
+        obj = RateLimitExample()
+        with self.assertRaises(ValueError):
+            obj.param.watch(print, 'a', debounce=-1)
+
+
+class TestAsyncRateLimitedWatchers(API1TestCase):
+
+    def setUp(self):
+        super(TestAsyncRateLimitedWatchers, self).setUp()
+        self.loop = asyncio.new_event_loop()
+        self.executor = AsyncExecutor(self.loop)
+        parameterized.async_executor = self.executor
+
+    def tearDown(self):
+        parameterized.async_executor = None
+        self.loop.close()
+        super(TestAsyncRateLimitedWatchers, self).tearDown()
+
+    def test_debounced_coroutine_on_loop(self):
+        obj = RateLimitExample()
+        events = []
+        async def watcher(*evts):
+            events.append(evts)
+        obj.param.watch(watcher, 'a', debounce=10)
+        async def burst():
+            for i in range(1, 4):
+                obj.a = i
+            await asyncio.sleep(0.05)
+            await self.executor.settled()
+        self.loop.run_until_complete(burst())
+        [(e,)] = events
+        self.assertEqual((e.old, e.new), (0, 3))
@@ -0,0 +1,96 @@
+"""
+Unit test for the lazily determined package version
+"""
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+
+import param
+
+from param import version
+
+from . import API1TestCase
+
+
+class TestCachedVersion(API1TestCase):
+
+    def setUp(self):
+        super(TestCachedVersion, self).setUp()
+        self.tmpdir = tempfile.mkdtemp()
+        self.package = os.path.join(self.tmpdir, 'pkg')
+        os.mkdir(self.package)
+        self.fpath = os.path.join(self.package, '__init__.py')
+        self.vfile = os.path.join(self.package, '.version')
+        self.commands = []
+        self._run_cmd = version.run_cmd
+        def run_cmd(args, cwd=None):
+            self.commands.append(args)
+            raise OSError('git not available')
+        version.run_cmd = run_cmd
+
+    def tearDown(self):
+        version.run_cmd = self._run_cmd
+        shutil.rmtree(self.tmpdir)
+        super(TestCachedVersion, self).tearDown()
+
+    def write_version_file(self, info):
+        with open(self.vfile, 'w') as f:
+            f.write(json.dumps(info))
+
+    def read_version_file(self):
+        with open(self.vfile) as f:
+            return json.loads(f.read())
+
+    def test_cached_version_string(self):
+        self.write_version_file({'git_describe': 'v1.2.0-0-gabcdef1',
+                                 'version_string': '1.2.0'})
+        self.assertEqual(version.get_cached_version(self.fpath, 'pkg'), '1.2.0')
+        self.assertEqual(self.commands, [])
+
+    def test_version_added_to_file(self):
+        self.write_version_file({'git_describe': 'v1.2.0-3-gabcdef1'})
+        self.assertEqual(version.get_cached_version(self.fpath, 'pkg'),
+                         '1.2.0.post3+gabcdef1')
+        self.assertEqual(self.read_version_file(),
+                         {'git_describe': 'v1.2.0-3-gabcdef1',
+                          'version_string': '1.2.0.post3+gabcdef1'})
+        del self.commands[:]
+        version.get_cached_version(self.fpath, 'pkg')
+        self.assertEqual(self.commands, [])
+
+    def test_missing_file_not_created(self):
+        version.get_cached_version(self.fpath, 'pkg')
+        self.assertFalse(os.path.exists(self.vfile))
+
+    def test_checkout_not_cached(self):
+        os.mkdir(os.path.join(self.tmpdir, '.git'))
+        self.write_version_file({'git_describe': 'v1.2.0-0-gabcdef1',
+                                 'version_string': '1.1.0'})
+        self.assertEqual(version.get_cached_version(self.fpath, 'pkg'), '1.2.0')
+        self.assertNotEqual(self.commands, [])
+        self.assertEqual(self.read_version_file()['version_string'], '1.1.0')
+
+
+class TestLazyVersion(API1TestCase):
+
+    def test_version_not_determined_on_import(self):
+        if sys.version_info < (3, 7):
+            return
+        code = ("import sys, param, numbergen; "
+                "print('param.version' in sys.modules, '__version__' in vars(param))")
+        output = subprocess.check_output(
+            [sys.executable, '-c', code],
+            cwd=os.path.dirname(os.path.dirname(param.__file__)))
+        self.assertEqual(output.decode().split(), ['False', 'False'])
+
+    def test_version_cached_on_module(self):
+        self.assertEqual(param.__version__, vars(param)['__version__'])
+        import numbergen
+        self.assertEqual(numbergen.__version__, param.__version__)
+
+    def test_missing_attribute(self):
+        with self.assertRaises(AttributeError):
+            param.not_an_attribute
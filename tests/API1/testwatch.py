@@ -5,7 +5,7 @@ import copy
 
 import param
 
-from param.parameterized import discard_events
+from param.parameterized import batch_call_watchers, discard_events
 
 from . import API1TestCase
 from .utils import MockLoggingHandler
@@ -146,6 +146,50 @@ class TestWatch(API1TestCase):
         obj.param.update(a=1, b=2)
         assert self.list_accumulator == ['B', 'A']
 
+    def test_priority_levels_stored_in_order(self):
+        obj = SimpleWatchExample()
+        w2 = obj.param.watch(lambda e: None, 'a', precedence=2)
+        w1 = obj.param.watch(lambda e: None, 'a', precedence=1)
+        w3 = obj.param.watch(lambda e: None, 'a', precedence=1)
+        self.assertEqual(list(obj._param_watchers['a']['value']), [w1, w3, w2])
+
+    def test_priority_levels_after_unwatch(self):
+        def accumulator(name):
+            return lambda change: self.list_accumulator.append(name)
+
+        obj = SimpleWatchExample()
+        obj.param.watch(accumulator('C'), 'a', precedence=3)
+        wb = obj.param.watch(accumulator('B'), 'a', precedence=2)
+        obj.param.watch(accumulator('A'), 'a', precedence=1)
+        obj.param.unwatch(wb)
+        obj.param.watch(accumulator('D'), 'a', precedence=2)
+
+        obj.a = 1
+        assert self.list_accumulator == ['A', 'D', 'C']
+
+    def test_unwatch_by_identity(self):
+        obj = SimpleWatchExample()
+        fn = lambda e: None
+        w1 = obj.param.watch(fn, 'a')
+        w2 = obj.param.watch(fn, 'a')
+        self.assertEqual(w1, w2)
+        obj.param.unwatch(w2)
+        self.assertIs(obj._param_watchers['a']['value'][0], w1)
+
+    def test_unwatch_during_dispatch(self):
+        obj = SimpleWatchExample()
+        def unwatching(event):
+            self.list_accumulator.append('A')
+            obj.param.unwatch(w1)
+        def accumulator(event):
+            self.list_accumulator.append('B')
+        w1 = obj.param.watch(unwatching, 'a')
+        obj.param.watch(accumulator, 'a', precedence=1)
+
+        obj.a = 1
+        obj.a = 2
+        assert self.list_accumulator == ['A', 'B', 'B']
+
     def test_triggered_when_changed_iterator_type(self):
         def accumulator(change):
             self.accumulator = change.new
@@ -863,3 +907,259 @@ class TestTrigger(API1TestCase):
 
         example.picker.value += 1
         assert example.da == 3
+
+
+class TestWatchInstances(API1TestCase):
+
+    def setUp(self):
+        super(TestWatchInstances, self).setUp()
+        class Device(param.Parameterized):
+            a = param.Parameter(default=0)
+            b = param.Parameter(default=0)
+        class SubDevice(Device):
+            pass
+        self.Device, self.SubDevice = Device, SubDevice
+        self.accumulator = Accumulator()
+
+    def test_watch_all_instances(self):
+        devices = [self.Device(), self.SubDevice()]
+        self.Device.param.watch_instances(self.accumulator, 'a')
+        devices[0].a = 1
+        devices[1].a = 2
+        devices[1].b = 3
+        self.assertEqual(self.accumulator.call_count(), 2)
+        events = [args[0] for args in self.accumulator.args]
+        self.assertEqual([(e.obj, e.new, e.type) for e in events],
+                         [(devices[0], 1, 'changed'), (devices[1], 2, 'changed')])
+        self.assertNotIn('a', devices[0]._param_watchers)
+
+    def test_watch_subclass_instances_only(self):
+        self.SubDevice.param.watch_instances(self.accumulator, 'a')
+        self.Device().a = 1
+        self.SubDevice().a = 1
+        self.assertEqual(self.accumulator.call_count(), 1)
+
+    def test_watch_instances_created_later(self):
+        self.Device.param.watch_instances(self.accumulator, ['a', 'b'])
+        device = self.Device()
+        device.param.update(a=1, b=2)
+        self.assertEqual(self.accumulator.call_count(), 1)
+        self.assertEqual([e.name for e in self.accumulator.args[0]], ['a', 'b'])
+
+    def test_watch_given_instances(self):
+        watched, other = self.Device(), self.Device()
+        self.Device.param.watch_instances(self.accumulator, 'a', instances=[watched])
+        other.a = 1
+        watched.a = 1
+        self.assertEqual(self.accumulator.call_count(), 1)
+        self.assertIs(self.accumulator.args[0][0].obj, watched)
+
+    def test_instances_not_kept_alive(self):
+        import gc
+        import weakref
+        device = self.Device()
+        self.Device.param.watch_instances(self.accumulator, 'a', instances=[device])
+        ref = weakref.ref(device)
+        del device
+        gc.collect()
+        self.assertIsNone(ref())
+
+    def test_precedence_with_instance_watchers(self):
+        device = self.Device()
+        calls = []
+        device.param.watch(lambda e: calls.append('instance'), 'a', precedence=2)
+        self.Device.param.watch_instances(lambda e: calls.append('class'), 'a', precedence=1)
+        device.a = 1
+        self.assertEqual(calls, ['class', 'instance'])
+
+    def test_unwatch_instances(self):
+        watcher = self.Device.param.watch_instances(self.accumulator, 'a')
+        self.Device.param.unwatch(watcher)
+        self.Device().a = 1
+        self.assertEqual(self.accumulator.call_count(), 0)
+
+    def test_watch_instances_on_instance(self):
+        with self.assertRaises(TypeError):
+            self.Device().param.watch_instances(self.accumulator, 'a')
+
+    def test_watch_instances_unknown_parameter(self):
+        with self.assertRaises(ValueError):
+            self.Device.param.watch_instances(self.accumulator, 'x')
+
+
+class WeakChild(param.Parameterized):
+    a = param.Parameter(default=0)
+
+
+class WeakParent(param.Parameterized):
+    child = param.Parameter()
+    count = param.Integer(default=0)
+
+    @param.depends('child.a', watch=True, weak=True)
+    def _count(self):
+        self.count += 1
+
+
+class TestWeakWatchers(API1TestCase):
+
+    def test_weak_function_pruned(self):
+        import gc
+        obj = SimpleWatchExample()
+        accumulator = Accumulator()
+        obj.param.watch(accumulator, 'a', weak=True)
+        obj.a = 1
+        self.assertEqual(accumulator.call_count(), 1)
+        del accumulator
+        gc.collect()
+        obj.a = 2
+        self.assertEqual(len(obj._param_watchers['a']['value']), 0)
+
+    def test_weak_method_pruned(self):
+        import gc
+        obj = SimpleWatchExample()
+        other = Accumulator()
+        obj.param.watch(other.__call__, 'a', weak=True)
+        obj.a = 1
+        self.assertEqual(other.call_count(), 1)
+        del other
+        gc.collect()
+        obj.a = 2
+        self.assertEqual(len(obj._param_watchers['a']['value']), 0)
+
+    def test_weak_watch_values(self):
+        obj = SimpleWatchExample()
+        accumulator = Accumulator()
+        obj.param.watch_values(accumulator, 'a', weak=True)
+        obj.a = 1
+        self.assertEqual(accumulator.kwargs, [{'a': 1}])
+
+    def test_weak_rate_limited_pruned(self):
+        import gc
+        obj = SimpleWatchExample()
+        accumulator = Accumulator()
+        obj.param.watch(accumulator, 'a', weak=True, throttle=1000)
+        obj.a = 1
+        self.assertEqual(accumulator.call_count(), 1)
+        del accumulator
+        gc.collect()
+        obj.a = 2
+        self.assertEqual(len(obj._param_watchers['a']['value']), 0)
+
+    def test_weak_depends_on_subobject(self):
+        import gc
+        import weakref
+        child = WeakChild()
+        parent = WeakParent(child=child)
+        child.a = 1
+        self.assertEqual(parent.count, 1)
+        ref = weakref.ref(parent)
+        del parent
+        gc.collect()
+        self.assertIsNone(ref())
+        child.a = 2
+        self.assertEqual(len(child._param_watchers['a']['value']), 0)
+
+    def test_weak_depends_subobject_replaced(self):
+        old_child = WeakChild()
+        parent = WeakParent(child=old_child)
+        new_child = WeakChild(a=1)
+        parent.child = new_child
+        self.assertEqual(parent.count, 1)
+        new_child.a = 2
+        self.assertEqual(parent.count, 2)
+        old_child.a = 3
+        self.assertEqual(parent.count, 2)
+
+    def test_weak_method_watcher_copied(self):
+        obj = SimpleWatchExample()
+        obj.param.watch(obj.method, 'a', weak=True)
+        copied = copy.deepcopy(obj)
+        copied.a = 2
+        self.assertEqual(copied.b, 4)
+        self.assertEqual(obj.b, 0)
+
+    def test_weak_function_dependencies_unsupported(self):
+        obj = SimpleWatchExample()
+        with self.assertRaises(ValueError):
+            param.depends(obj.param.a, watch=True, weak=True)(lambda a: None)
+
+
+class TestCoalescedBatch(API1TestCase):
+
+    def test_first_old_last_new(self):
+        obj = SimpleWatchExample()
+        accumulator = Accumulator()
+        obj.param.watch(accumulator, ['a', 'b'])
+        with batch_call_watchers(obj, coalesce=True):
+            obj.a = 1
+            obj.b = 1
+            obj.a = 2
+            obj.a = 3
+            self.assertEqual(len(obj.param._events), 2)
+        self.assertEqual(accumulator.call_count(), 1)
+        events = accumulator.args_for_call(0)
+        self.assertEqual([(e.name, e.old, e.new, e.type) for e in events],
+                         [('a', 0, 3, 'changed'), ('b', 0, 1, 'changed')])
+
+    def test_unchanged_value_skipped(self):
+        obj = SimpleWatchExample()
+        accumulator = Accumulator()
+        obj.param.watch(accumulator, 'a')
+        with batch_call_watchers(obj, coalesce=True):
+            obj.a = 1
+            obj.a = 0
+        self.assertEqual(accumulator.call_count(), 0)
+
+    def test_unchanged_value_passed_to_set_watchers(self):
+        obj = SimpleWatchExample()
+        accumulator = Accumulator()
+        obj.param.watch(accumulator, 'a', onlychanged=False)
+        with batch_call_watchers(obj, coalesce=True):
+            obj.a = 1
+            obj.a = 0
+        [event] = accumulator.args_for_call(0)
+        self.assertEqual((event.old, event.new, event.type), (0, 0, 'set'))
+
+    def test_unchanged_parameter_dropped_from_call(self):
+        obj = SimpleWatchExample()
+        accumulator = Accumulator()
+        obj.param.watch(accumulator, ['a', 'b'])
+        with batch_call_watchers(obj, coalesce=True):
+            obj.a = 1
+            obj.a = 0
+            obj.b = 1
+        [event] = accumulator.args_for_call(0)
+        self.assertEqual(event.name, 'b')
+
+    def test_set_to_value_then_changed(self):
+        obj = SimpleWatchExample()
+        accumulator = Accumulator()
+        obj.param.watch(accumulator, 'a')
+        with batch_call_watchers(obj, coalesce=True):
+            obj.a = 0
+            obj.a = 2
+        [event] = accumulator.args_for_call(0)
+        self.assertEqual((event.old, event.new), (0, 2))
+
+    def test_update_coalesced(self):
+        obj = SimpleWatchExample()
+        accumulator = Accumulator()
+        obj.param.watch(accumulator, 'a')
+        with batch_call_watchers(obj, coalesce=True):
+            obj.param.update(a=1)
+            obj.param.update(a=2)
+        [event] = accumulator.args_for_call(0)
+        self.assertEqual((event.old, event.new), (0, 2))
+
+    def test_coalescing_ends_with_batch(self):
+        obj = SimpleWatchExample()
+        accumulator = Accumulator()
+        obj.param.watch(accumulator, 'a')
+        with batch_call_watchers(obj, coalesce=True):
+            obj.a = 1
+        with batch_call_watchers(obj):
+            obj.a = 2
+            obj.a = 3
+        [event] = accumulator.args_for_call(1)
+        self.assertEqual((event.old, event.new), (2, 3))
+        self.assertFalse(obj.param._events.coalesce)
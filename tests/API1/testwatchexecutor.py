@@ -0,0 +1,179 @@
+"""
+Unit test for running watchers on executors
+"""
+import pickle
+import threading
+import time
+
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+import param
+
+from param import parameterized
+
+from . import API1TestCase
+
+
+class ExecutorExample(param.Parameterized):
+
+    a = param.Number(default=0)
+
+    b = param.Number(default=0)
+
+    c = param.Number(default=0)
+
+    @param.depends('a', watch=True)
+    def _update_c(self):
+        self.c = self.a + 1
+
+
+class PicklableExample(param.Parameterized):
+
+    b = param.Number(default=0)
+
+
+def new_value(event):
+    return event.new
+
+
+class TestWatcherExecutors(API1TestCase):
+
+    def setUp(self):
+        super(TestWatcherExecutors, self).setUp()
+        self.executor = ThreadPoolExecutor(max_workers=4)
+
+    def tearDown(self):
+        self.executor.shutdown()
+        parameterized.watcher_executor = None
+        super(TestWatcherExecutors, self).tearDown()
+
+    def test_watch_executor(self):
+        obj = ExecutorExample()
+        threads = []
+        obj.param.watch(lambda event: threads.append(threading.current_thread()),
+                        'b', executor=self.executor)
+        obj.b = 1
+        self.assertTrue(obj.param.join_watchers())
+        self.assertEqual(len(threads), 1)
+        self.assertIsNot(threads[0], threading.current_thread())
+
+    def test_watch_values_executor(self):
+        obj = ExecutorExample()
+        values = []
+        obj.param.watch_values(lambda b: values.append(b), 'b', executor=self.executor)
+        obj.b = 2
+        obj.param.join_watchers()
+        self.assertEqual(values, [2])
+
+    def test_object_executor_runs_depends(self):
+        obj = ExecutorExample()
+        obj.param.set_watcher_executor(self.executor)
+        threads = []
+        obj.param.watch(lambda event: threads.append(threading.current_thread()), 'c')
+        obj.a = 1
+        obj.param.join_watchers()
+        self.assertEqual(obj.c, 2)
+        self.assertEqual(len(threads), 1)
+        self.assertIsNot(threads[0], threading.current_thread())
+        self.assertIsNone(ExecutorExample().param.self_or_cls._param_executor)
+
+    def test_global_executor(self):
+        parameterized.watcher_executor = self.executor
+        obj = ExecutorExample()
+        threads = []
+        obj.param.watch(lambda event: threads.append(threading.current_thread()), 'b')
+        obj.b = 1
+        obj.param.join_watchers()
+        self.assertIsNot(threads[0], threading.current_thread())
+
+    def test_calls_of_watcher_in_order(self):
+        obj = ExecutorExample()
+        values = []
+        def slow(event):
+            time.sleep(0.01 if event.new == 1 else 0)
+            values.append(event.new)
+        obj.param.watch(slow, 'b', executor=self.executor)
+        for i in range(1, 4):
+            obj.b = i
+        obj.param.join_watchers()
+        self.assertEqual(values, [1, 2, 3])
+
+    def test_precedence_ordering(self):
+        obj = ExecutorExample()
+        log = []
+        def first(event):
+            time.sleep(0.01)
+            log.append('first')
+        obj.param.watch(first, 'b', precedence=0, executor=self.executor)
+        obj.param.watch(lambda event: log.append('second'), 'b', precedence=1,
+                        executor=self.executor)
+        obj.b = 1
+        obj.param.join_watchers()
+        self.assertEqual(log, ['first', 'second'])
+
+    def test_same_precedence_concurrent(self):
+        obj = ExecutorExample()
+        barrier = threading.Barrier(2, timeout=5)
+        obj.param.watch(lambda event: barrier.wait(), 'b', executor=self.executor)
+        obj.param.watch(lambda event: barrier.wait(), 'b', executor=self.executor)
+        obj.b = 1
+        self.assertTrue(obj.param.join_watchers(timeout=5))
+
+    def test_join_raises(self):
+        obj = ExecutorExample()
+        def fail(event):
+            raise RuntimeError('watcher failed')
+        obj.param.watch(fail, 'b', executor=self.executor)
+        obj.b = 1
+        with self.assertRaises(RuntimeError):
+            obj.param.join_watchers()
+        self.assertTrue(obj.param.join_watchers())
+
+    def test_join_timeout(self):
+        obj = ExecutorExample()
+        release = threading.Event()
+        obj.param.watch(lambda event: release.wait(5), 'b', executor=self.executor)
+        obj.b = 1
+        self.assertFalse(obj.param.join_watchers(timeout=0.01))
+        release.set()
+        self.assertTrue(obj.param.join_watchers())
+
+    def test_queued_watcher_dispatches_on_return(self):
+        obj = ExecutorExample()
+        events = []
+        def set_a(event):
+            obj.a = event.new
+            events.append(('after set', obj.c))
+        obj.param.watch(set_a, 'b', queued=True, executor=self.executor)
+        obj.b = 5
+        obj.param.join_watchers()
+        self.assertEqual(events, [('after set', 0)])
+        self.assertEqual(obj.c, 6)
+
+    def test_executor_not_pickled(self):
+        obj = PicklableExample()
+        obj.param.set_watcher_executor(self.executor)
+        obj.param.watch(new_value, 'b', precedence=2, executor=self.executor)
+        obj.b = 1
+        obj.param.join_watchers()
+        unpickled = pickle.loads(pickle.dumps(obj))
+        [watcher] = unpickled._param_watchers['b']['value']
+        self.assertIsNone(watcher.executor)
+        self.assertEqual(watcher.precedence, 2)
+        self.assertIsNone(unpickled._param_executor)
+
+    def test_watcher_unpacking(self):
+        obj = ExecutorExample()
+        watcher = obj.param.watch(new_value, 'b', executor=self.executor)
+        self.assertEqual(len(list(watcher)), 8)
+        self.assertIs(watcher.executor, self.executor)
+
+    def test_process_pool(self):
+        executor = ProcessPoolExecutor(max_workers=1)
+        try:
+            obj = PicklableExample()
+            obj.param.watch(new_value, 'b', executor=executor)
+            obj.b = 3
+            self.assertTrue(obj.param.join_watchers(timeout=30))
+        finally:
+            executor.shutdown()